@@ -6,6 +6,7 @@ Extracts article information from websites using JSON-LD, RSS, and HTML heuristi
 from typing import Dict, Any, List, Optional, Tuple
 from urllib.parse import urlparse, urljoin
 from dataclasses import dataclass, field
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 import re
 import json
@@ -127,9 +128,16 @@ class ArticleExtractor:
     # Minimum word count for non-thin content
     MIN_WORD_COUNT = 300
     
-    def __init__(self):
-        """Initialize article extractor"""
-        self.http_client = HTTPClient(timeout=15)
+    def __init__(self, max_workers: int = 8, http_client: Optional[HTTPClient] = None):
+        """
+        Initialize article extractor
+        
+        Args:
+            max_workers: Maximum concurrent page fetches
+            http_client: Shared HTTP client (a new one is created if None)
+        """
+        self.http_client = http_client or HTTPClient(timeout=15)
+        self.max_workers = max_workers
         
         if not EXTRUCT_AVAILABLE:
             print("  [!] extruct not installed - JSON-LD extraction will be limited")
@@ -149,9 +157,15 @@ class ArticleExtractor:
         
         print(f"  [+] Extracting articles from {len(urls)} URLs...")
         
-        for url in urls[:max_articles]:
+        urls = urls[:max_articles]
+        
+        # Fetch pages concurrently; results are merged in URL order
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            futures = [(url, executor.submit(self.extract_single, url)) for url in urls]
+        
+        for url, future in futures:
             try:
-                article = self.extract_single(url)
+                article = future.result()
                 if article:
                     result.articles.append(article)
                     
@@ -6,6 +6,7 @@ Extracts product information from e-commerce websites
 from typing import Dict, Any, List, Optional
 from urllib.parse import urlparse, urljoin
 from dataclasses import dataclass, field
+from concurrent.futures import ThreadPoolExecutor
 import re
 import json
 
@@ -140,9 +141,16 @@ class ProductExtractor:
         ]
     }
     
-    def __init__(self):
-        """Initialize product extractor"""
-        self.http_client = HTTPClient(timeout=15)
+    def __init__(self, max_workers: int = 8, http_client: Optional[HTTPClient] = None):
+        """
+        Initialize product extractor
+        
+        Args:
+            max_workers: Maximum concurrent page fetches
+            http_client: Shared HTTP client (a new one is created if None)
+        """
+        self.http_client = http_client or HTTPClient(timeout=15)
+        self.max_workers = max_workers
         
         if not EXTRUCT_AVAILABLE:
             print("  [!] extruct not installed - JSON-LD extraction will be limited")
@@ -163,9 +171,15 @@ class ProductExtractor:
         
         print(f"  [+] Extracting products from {len(urls)} URLs...")
         
-        for url in urls[:max_products]:
+        urls = urls[:max_products]
+        
+        # Fetch pages concurrently; results are merged in URL order
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            futures = [(url, executor.submit(self.extract_single, url)) for url in urls]
+        
+        for url, future in futures:
             try:
-                product = self.extract_single(url)
+                product = future.result()
                 if product:
                     result.products.append(product)
                     
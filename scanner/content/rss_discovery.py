@@ -4,9 +4,12 @@ Discovers and parses RSS/Atom feeds from websites
 """
 
 from typing import Dict, Any, List, Optional
-from urllib.parse import urljoin, urlparse
+from urllib.parse import urlparse
 from dataclasses import dataclass, field
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from io import BytesIO
+import html
 import re
 
 try:
@@ -15,11 +18,50 @@ try:
 except ImportError:
     FEEDPARSER_AVAILABLE = False
 
-from bs4 import BeautifulSoup
-from utils.http_client import HTTPClient
+from bs4 import BeautifulSoup, SoupStrainer
+from lxml import etree
+from utils.helpers import DATACLASS_SLOTS, join_url, json_dumps_bytes, url_origin
+from utils.http_client import HTTPClient, probe_miss_cache
 
 
-@dataclass
+# <link ...> tags and their attributes, for regex-based feed autodiscovery
+LINK_TAG_RE = re.compile(r'<link\b[^>]*>', re.IGNORECASE)
+LINK_ATTR_RE = re.compile(r'([\w:-]+)\s*=\s*(?:"([^"]*)"|\'([^\']*)\'|([^\s"\'>]+))')
+
+# Parse-time filter for the BeautifulSoup fallback: only <link rel="alternate">
+ALTERNATE_LINK_STRAINER = SoupStrainer(
+    'link', rel=lambda value: bool(value) and 'alternate' in value.lower()
+)
+
+# <link type="..."> values used for feed autodiscovery
+FEED_LINK_TYPES = frozenset([
+    'application/rss+xml',
+    'application/atom+xml',
+    'application/rdf+xml',
+    'application/xml',
+    'text/xml'
+])
+
+# Content-Type fragments that identify a feed response
+FEED_CONTENT_TYPE_RE = re.compile(r'xml|rss|atom|feed')
+
+# Any mention of a feed anywhere on a page
+FEED_HINT_RE = re.compile(r'rss|atom|feed', re.IGNORECASE)
+
+# lxml options shared by every feed parse: tolerate malformed feeds, never
+# expand entities or touch the network, and skip whitespace-only text nodes
+FEED_PARSER_OPTIONS = {
+    'recover': True,
+    'resolve_entities': False,
+    'no_network': True,
+    'remove_blank_text': True,
+}
+
+# Leading markup that identifies a feed body served with a generic Content-Type
+FEED_SNIFF_RE = re.compile(rb'<rss|<feed|<\?xml', re.IGNORECASE)
+
+
+@dataclass(**DATACLASS_SLOTS)
 class FeedItem:
     """Represents an item from RSS/Atom feed"""
     title: str
@@ -40,7 +82,7 @@ class FeedItem:
         }
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class FeedResult:
     """Result of RSS/Atom discovery"""
     found: bool = False
@@ -60,11 +102,27 @@ class FeedResult:
             'feed_type': self.feed_type,
             'title': self.title,
             'description': self.description,
-            'items': [i.to_dict() for i in self.items],
+            # Built inline rather than via FeedItem.to_dict() to skip a
+            # method call per item
+            'items': [
+                {
+                    'title': i.title,
+                    'url': i.url,
+                    'published': i.published,
+                    'author': i.author,
+                    'summary': i.summary,
+                    'categories': i.categories
+                }
+                for i in self.items
+            ],
             'total_items': self.total_items,
             'errors': self.errors,
             'warnings': self.warnings
         }
+    
+    def to_json_bytes(self) -> bytes:
+        """Serialize to UTF-8 JSON without an intermediate str"""
+        return json_dumps_bytes(self.to_dict())
 
 
 class RSSDiscovery:
@@ -95,15 +153,28 @@ class RSSDiscovery:
         '/feed/atom/',
     ]
     
-    def __init__(self, max_items: int = 100):
+    # Content-Types too generic to rule a feed out from headers alone
+    AMBIGUOUS_CONTENT_TYPES = ('text/plain', 'application/octet-stream')
+    
+    # Upper bound on homepage bytes read while looking for </head>
+    MAX_HEAD_BYTES = 512 * 1024
+    
+    # URL path suffixes that indicate a feed document
+    FEED_EXTENSIONS = ('.xml', '.rss', '.atom')
+    
+    def __init__(self, max_items: int = 100, max_workers: int = 8,
+                 http_client: Optional[HTTPClient] = None):
         """
         Initialize RSS discovery
         
         Args:
             max_items: Maximum items to collect from feeds
+            max_workers: Maximum concurrent feed probes
+            http_client: Shared HTTP client (a new one is created if None)
         """
-        self.http_client = HTTPClient(timeout=15)
+        self.http_client = http_client or HTTPClient(timeout=15)
         self.max_items = max_items
+        self.max_workers = max_workers
         
         if not FEEDPARSER_AVAILABLE:
             print("  [!] feedparser not installed - RSS parsing will be limited")
@@ -120,51 +191,34 @@ class RSSDiscovery:
             FeedResult with discovered feed items
         """
         result = FeedResult()
-        parsed_url = urlparse(base_url)
-        base = f"{parsed_url.scheme}://{parsed_url.netloc}"
-        
-        feed_urls_to_check = []
+        base = url_origin(base_url)
         
         print(f"  [+] Discovering RSS/Atom feeds for {base}...")
         
         # First, try to discover from HTML <link> tags
         if html_content:
             discovered = self._discover_from_html(html_content, base)
-            feed_urls_to_check.extend(discovered)
         else:
-            # Fetch homepage to look for feed links
-            response = self.http_client.get(base_url)
-            if response and response.status_code == 200:
-                discovered = self._discover_from_html(response.text, base)
-                feed_urls_to_check.extend(discovered)
-        
-        # Add common paths
-        for path in self.COMMON_PATHS:
-            feed_url = urljoin(base, path)
-            if feed_url not in feed_urls_to_check:
-                feed_urls_to_check.append(feed_url)
-        
-        # Try each feed URL
-        for feed_url in feed_urls_to_check:
-            if result.found and len(result.items) >= self.max_items:
-                break
-            
-            feed_data = self._fetch_and_parse_feed(feed_url)
-            
-            if feed_data:
-                result.found = True
-                result.feed_urls.append(feed_url)
-                
-                if not result.title:
-                    result.title = feed_data.get('title')
-                if not result.description:
-                    result.description = feed_data.get('description')
-                if not result.feed_type:
-                    result.feed_type = feed_data.get('type')
-                
-                for item in feed_data.get('items', []):
-                    if len(result.items) < self.max_items:
-                        result.items.append(item)
+            # Fetch homepage <head> to look for feed links
+            head_content = self._fetch_html_head(base_url)
+            discovered = self._discover_from_html(head_content, base) if head_content else []
+        
+        self._probe_feeds(discovered, result)
+        
+        # Fall back to guessing common paths only when autodiscovery came up
+        # empty. A full homepage that never mentions rss/atom/feed almost
+        # certainly has no feed, so skip the speculative probes entirely.
+        if not result.found:
+            if html_content and not FEED_HINT_RE.search(html_content):
+                print(f"  [-] Homepage does not reference a feed - skipping common paths")
+                result.warnings.append("Homepage does not reference an RSS or Atom feed")
+            else:
+                checked = set(discovered)
+                common_urls = [join_url(base, path) for path in self.COMMON_PATHS]
+                self._probe_feeds(
+                    [u for u in dict.fromkeys(common_urls) if u not in checked],
+                    result
+                )
         
         result.total_items = len(result.items)
         
@@ -172,10 +226,87 @@ class RSSDiscovery:
             print(f"  [+] Found {len(result.feed_urls)} feed(s) with {result.total_items} items")
         else:
             print(f"  [-] No RSS/Atom feeds found")
-            result.warnings.append("No RSS or Atom feed found at common locations")
+            if not result.warnings:
+                result.warnings.append("No RSS or Atom feed found at common locations")
         
         return result
     
+    def _probe_feeds(self, feed_urls: List[str], result: FeedResult) -> None:
+        """
+        Fetch candidate feed URLs concurrently and merge them into result
+        
+        Results are merged in candidate order so earlier URLs keep priority.
+        
+        Args:
+            feed_urls: Candidate feed URLs
+            result: FeedResult to update
+        """
+        if not feed_urls:
+            return
+        
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            futures = [
+                (feed_url, executor.submit(self._fetch_and_parse_feed, feed_url))
+                for feed_url in feed_urls
+            ]
+            
+            for feed_url, future in futures:
+                if result.found and len(result.items) >= self.max_items:
+                    for _, pending in futures:
+                        pending.cancel()
+                    break
+                
+                feed_data = future.result()
+                
+                if feed_data:
+                    result.found = True
+                    result.feed_urls.append(feed_url)
+                    
+                    if not result.title:
+                        result.title = feed_data.get('title')
+                    if not result.description:
+                        result.description = feed_data.get('description')
+                    if not result.feed_type:
+                        result.feed_type = feed_data.get('type')
+                    
+                    for item in feed_data.get('items', []):
+                        if len(result.items) < self.max_items:
+                            result.items.append(item)
+    
+    def _fetch_html_head(self, url: str) -> Optional[str]:
+        """
+        Fetch a page and stop reading once its </head> has arrived
+        
+        Args:
+            url: Page URL
+            
+        Returns:
+            HTML up to and including </head>, or None if the fetch failed
+        """
+        response = self.http_client.get(url, stream=True)
+        if not response or response.status_code != 200:
+            return None
+        
+        buffer = bytearray()
+        try:
+            for chunk in response.iter_content(chunk_size=8192):
+                # Re-check the tail of the previous chunk in case the tag was split
+                search_from = max(len(buffer) - 6, 0)
+                buffer.extend(chunk)
+                head_end = buffer[search_from:].lower().find(b'</head>')
+                if head_end != -1:
+                    del buffer[search_from + head_end + 7:]
+                    break
+                if len(buffer) >= self.MAX_HEAD_BYTES:
+                    break
+        except Exception as e:
+            if not buffer:
+                return None
+        finally:
+            response.close()
+        
+        return bytes(buffer).decode(response.encoding or 'utf-8', errors='replace')
+    
     def _discover_from_html(self, html_content: str, base_url: str) -> List[str]:
         """
         Discover feed URLs from HTML link tags
@@ -187,28 +318,55 @@ class RSSDiscovery:
         Returns:
             List of feed URLs
         """
+        # Autodiscovery links always live in <head>
+        head_end = html_content.lower().find('</head>')
+        head = html_content[:head_end + 7] if head_end != -1 else html_content
+        
+        feed_urls = self._discover_links_regex(head, base_url)
+        
+        # Fall back to a real parser only when the cheap scan may have missed something
+        if not feed_urls and 'alternate' in head.lower():
+            feed_urls = self._discover_links_soup(head, base_url)
+        
+        # Drop duplicates while keeping document order
+        return list(dict.fromkeys(feed_urls))
+    
+    def _discover_links_regex(self, html_content: str, base_url: str) -> List[str]:
+        """Extract feed URLs from <link rel="alternate"> tags with a regex scan"""
         feed_urls = []
         
-        try:
-            soup = BeautifulSoup(html_content, 'html.parser')
+        for tag in LINK_TAG_RE.finditer(html_content):
+            attrs = {}
+            for match in LINK_ATTR_RE.finditer(tag.group(0)):
+                name, *values = match.groups()
+                attrs[name.lower()] = next((v for v in values if v is not None), '')
             
-            # Look for RSS/Atom link tags
-            feed_link_types = [
-                'application/rss+xml',
-                'application/atom+xml',
-                'application/rdf+xml',
-                'application/xml',
-                'text/xml'
-            ]
+            if 'alternate' not in attrs.get('rel', '').lower().split():
+                continue
+            
+            link_type = attrs.get('type', '').split(';', 1)[0].strip().lower()
+            href = html.unescape(attrs.get('href', '')).strip()
             
-            for link in soup.find_all('link', rel=re.compile(r'alternate', re.I)):
-                link_type = link.get('type', '').lower()
+            if link_type in FEED_LINK_TYPES and href:
+                feed_urls.append(join_url(base_url, href))
+        
+        return feed_urls
+    
+    def _discover_links_soup(self, html_content: str, base_url: str) -> List[str]:
+        """Extract feed URLs from <link rel="alternate"> tags with BeautifulSoup"""
+        feed_urls = []
+        
+        try:
+            # Only <link rel="alternate"> elements matter for autodiscovery,
+            # so let lxml skip building everything else
+            soup = BeautifulSoup(html_content, 'lxml', parse_only=ALTERNATE_LINK_STRAINER)
+            
+            for link in soup.find_all('link'):
+                link_type = link.get('type', '').split(';', 1)[0].strip().lower()
                 href = link.get('href', '')
                 
-                if any(ft in link_type for ft in feed_link_types) and href:
-                    feed_url = urljoin(base_url, href)
-                    if feed_url not in feed_urls:
-                        feed_urls.append(feed_url)
+                if link_type in FEED_LINK_TYPES and href:
+                    feed_urls.append(join_url(base_url, href))
             
         except Exception as e:
             pass
@@ -225,33 +383,92 @@ class RSSDiscovery:
         Returns:
             Parsed feed data or None
         """
+        cache_key = f"feed:{url}"
+        if cache_key in probe_miss_cache:
+            return None
+        
+        feed_data = self._fetch_and_parse_feed_uncached(url)
+        if feed_data is None:
+            probe_miss_cache.add(cache_key)
+        
+        return feed_data
+    
+    def _fetch_and_parse_feed_uncached(self, url: str) -> Optional[Dict[str, Any]]:
+        """Fetch and parse a feed, bypassing the negative cache"""
         try:
-            response = self.http_client.get(url)
+            if not self._head_may_be_feed(url):
+                return None
+            
+            response = self.http_client.get(url, stream=True)
             
             if not response or response.status_code != 200:
                 return None
             
-            content_type = response.headers.get('Content-Type', '').lower()
-            
-            # Check if it's likely a feed
-            if not any(ft in content_type for ft in ['xml', 'rss', 'atom', 'feed']):
-                # Check content for XML indicators
-                content_start = response.text[:500].lower()
-                if '<rss' not in content_start and '<feed' not in content_start and '<?xml' not in content_start:
-                    return None
+            try:
+                chunks = response.iter_content(chunk_size=16 * 1024)
+                first_chunk = next(chunks, b'')
+                
+                # Check if it's likely a feed, sniffing the first bytes when
+                # the Content-Type doesn't say so; reject before reading on
+                content_type = response.headers.get('Content-Type', '').lower()
+                if not FEED_CONTENT_TYPE_RE.search(content_type):
+                    if not FEED_SNIFF_RE.search(first_chunk[:512]):
+                        return None
+                
+                content = first_chunk + b''.join(chunks)
+            finally:
+                response.close()
             
             if FEEDPARSER_AVAILABLE:
-                return self._parse_with_feedparser(response.content, url)
+                return self._parse_with_feedparser(content, url)
             else:
-                return self._parse_manually(response.text, url)
+                return self._parse_manually(content, url)
             
         except Exception as e:
             return None
     
+    def _head_may_be_feed(self, url: str) -> bool:
+        """
+        Rule out obvious non-feeds from a HEAD request before downloading the body
+        
+        Args:
+            url: Feed URL
+            
+        Returns:
+            False if the headers show the URL is not a feed, True otherwise
+        """
+        response = self.http_client.head(url, allow_redirects=True)
+        
+        # HEAD unsupported or failed - let the GET decide
+        if response is None:
+            return True
+        
+        if response.status_code in (404, 410):
+            return False
+        
+        if response.status_code != 200:
+            return True
+        
+        content_type = response.headers.get('Content-Type', '').lower()
+        
+        if not content_type or content_type.startswith(self.AMBIGUOUS_CONTENT_TYPES):
+            return True
+        
+        if FEED_CONTENT_TYPE_RE.search(content_type):
+            return True
+        
+        return urlparse(url).path.lower().endswith(self.FEED_EXTENSIONS)
+    
     def _parse_with_feedparser(self, content: bytes, url: str) -> Optional[Dict[str, Any]]:
         """Parse feed using feedparser library"""
         try:
-            parsed = feedparser.parse(content)
+            # Item summaries are truncated plain data, so skip feedparser's
+            # HTML sanitizer and relative URI rewriting - its dominant costs
+            parsed = feedparser.parse(
+                self._truncate_feed(content),
+                sanitize_html=False,
+                resolve_relative_uris=False
+            )
             
             if parsed.bozo and not parsed.entries:
                 return None
@@ -300,84 +517,95 @@ class RSSDiscovery:
         except Exception as e:
             return None
     
-    def _parse_manually(self, content: str, url: str) -> Optional[Dict[str, Any]]:
-        """Parse feed manually without feedparser"""
+    def _truncate_feed(self, content: bytes) -> bytes:
+        """
+        Cut a feed down to its first max_items entries
+        
+        Args:
+            content: Raw feed bytes
+            
+        Returns:
+            Re-serialized feed without the surplus entries, or the original
+            bytes if the feed is already small enough or cannot be parsed
+        """
+        # Tag counts are an upper bound on the entries (prefixed tags too),
+        # so most feeds skip the parse entirely
+        tags = (content.count(b'<item') + content.count(b'<entry') +
+                content.count(b':item') + content.count(b':entry'))
+        if tags <= self.max_items:
+            return content
+        
         try:
-            soup = BeautifulSoup(content, 'xml')
+            context = etree.iterparse(
+                BytesIO(content),
+                events=('start',),
+                **FEED_PARSER_OPTIONS
+            )
             
+            count = 0
+            for _, elem in context:
+                if self._local_name(elem) in ('item', 'entry'):
+                    count += 1
+                    if count > self.max_items:
+                        # The parser reads ahead in chunks, so drop this entry and
+                        # any later ones already built, then stop reading
+                        parent = elem.getparent()
+                        for surplus in [elem] + list(elem.itersiblings()):
+                            if self._local_name(surplus) in ('item', 'entry'):
+                                parent.remove(surplus)
+                        
+                        root = elem.getroottree().getroot()
+                        return etree.tostring(root, xml_declaration=True, encoding='utf-8')
+        except Exception as e:
+            pass
+        
+        return content
+    
+    def _parse_manually(self, content: bytes, url: str) -> Optional[Dict[str, Any]]:
+        """Parse feed manually without feedparser"""
+        if isinstance(content, str):
+            content = content.encode('utf-8')
+        
+        try:
             items = []
             feed_type = 'rss'
             title = ''
             description = ''
             
-            # Try RSS format
-            channel = soup.find('channel')
-            if channel:
-                title = channel.find('title')
-                title = title.get_text() if title else ''
-                
-                desc = channel.find('description')
-                description = desc.get_text() if desc else ''
-                
-                for item in channel.find_all('item'):
-                    item_title = item.find('title')
-                    item_link = item.find('link')
-                    
-                    feed_item = FeedItem(
-                        title=item_title.get_text() if item_title else 'No Title',
-                        url=item_link.get_text() if item_link else ''
-                    )
-                    
-                    pub_date = item.find('pubDate')
-                    if pub_date:
-                        feed_item.published = pub_date.get_text()
-                    
-                    author = item.find('author') or item.find('dc:creator')
-                    if author:
-                        feed_item.author = author.get_text()
-                    
-                    desc = item.find('description')
-                    if desc:
-                        text = desc.get_text()
-                        feed_item.summary = text[:500] if len(text) > 500 else text
-                    
-                    items.append(feed_item)
+            # Stream through the document one element at a time, releasing
+            # each <item>/<entry> subtree as soon as it has been read
+            context = etree.iterparse(
+                BytesIO(content),
+                events=('end',),
+                **FEED_PARSER_OPTIONS
+            )
             
-            # Try Atom format
-            feed = soup.find('feed')
-            if feed and not items:
-                feed_type = 'atom'
-                
-                title_tag = feed.find('title')
-                title = title_tag.get_text() if title_tag else ''
-                
-                subtitle = feed.find('subtitle')
-                description = subtitle.get_text() if subtitle else ''
+            for _, elem in context:
+                tag = self._local_name(elem)
                 
-                for entry in feed.find_all('entry'):
-                    entry_title = entry.find('title')
-                    entry_link = entry.find('link', href=True)
+                if tag in ('item', 'entry'):
+                    if tag == 'entry':
+                        feed_type = 'atom'
                     
-                    feed_item = FeedItem(
-                        title=entry_title.get_text() if entry_title else 'No Title',
-                        url=entry_link['href'] if entry_link else ''
-                    )
+                    items.append(self._feed_item_from_element(elem))
                     
-                    published = entry.find('published') or entry.find('updated')
-                    if published:
-                        feed_item.published = published.get_text()
+                    elem.clear()
+                    while elem.getprevious() is not None:
+                        del elem.getparent()[0]
                     
-                    author = entry.find('author')
-                    if author:
-                        name = author.find('name')
-                        feed_item.author = name.get_text() if name else ''
-                    
-                    summary = entry.find('summary') or entry.find('content')
-                    if summary:
-                        text = summary.get_text()
-                        feed_item.summary = text[:500] if len(text) > 500 else text
+                    if len(items) >= self.max_items:
+                        break
+                
+                elif tag in ('title', 'description', 'subtitle'):
+                    parent = elem.getparent()
+                    if parent is None or self._local_name(parent) not in ('channel', 'feed'):
+                        continue
                     
-                    items.append(feed_item)
+                    text = ''.join(elem.itertext())
+                    if tag == 'title':
+                        title = title or text
+                    else:
+                        description = description or text
             
             if items:
                 return {
@@ -391,3 +619,61 @@ class RSSDiscovery:
             
         except Exception as e:
             return None
+    
+    @staticmethod
+    def _local_name(elem: etree._Element) -> str:
+        """Get element tag name without its XML namespace"""
+        tag = elem.tag
+        if not isinstance(tag, str):
+            return ''
+        return tag.rsplit('}', 1)[-1]
+    
+    def _feed_item_from_element(self, elem: etree._Element) -> FeedItem:
+        """Build a FeedItem from an RSS <item> or Atom <entry> element"""
+        children: Dict[str, List[etree._Element]] = {}
+        for child in elem:
+            children.setdefault(self._local_name(child), []).append(child)
+        
+        def text_of(*names: str) -> Optional[str]:
+            for name in names:
+                if name in children:
+                    return ''.join(children[name][0].itertext())
+            return None
+        
+        # RSS carries the URL as text, Atom as an href attribute
+        url = ''
+        for link in children.get('link', []):
+            href = link.get('href')
+            if href is None:
+                url = ''.join(link.itertext()).strip()
+                break
+            if link.get('rel', 'alternate') == 'alternate':
+                url = href
+                break
+            url = url or href
+        
+        feed_item = FeedItem(
+            title=text_of('title') or 'No Title',
+            url=url
+        )
+        
+        feed_item.published = text_of('pubDate', 'published', 'updated', 'date')
+        
+        # Atom nests the author's <name>; RSS uses plain text
+        if 'author' in children:
+            author = children['author'][0]
+            names = [c for c in author if self._local_name(c) == 'name']
+            feed_item.author = ''.join((names[0] if names else author).itertext())
+        else:
+            feed_item.author = text_of('creator')
+        
+        summary = text_of('description', 'summary', 'content')
+        if summary:
+            feed_item.summary = summary[:500] if len(summary) > 500 else summary
+        
+        for category in children.get('category', []):
+            term = category.get('term') or ''.join(category.itertext())
+            if term:
+                feed_item.categories.append(term)
+        
+        return feed_item
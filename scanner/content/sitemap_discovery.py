@@ -3,16 +3,35 @@ Sitemap Discovery Module
 Discovers and parses XML sitemaps from websites
 """
 
+import gzip
+import io
 import re
 from typing import Dict, Any, List, Optional, Set
-from urllib.parse import urljoin, urlparse
+from urllib.parse import urlparse
 from dataclasses import dataclass, field
 from datetime import datetime
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+import requests
 from lxml import etree
-from utils.http_client import HTTPClient
+from utils.helpers import DATACLASS_SLOTS, join_url, json_dumps_bytes, url_origin
+from utils.http_client import HTTPClient, probe_miss_cache
 
 
-@dataclass
+# lxml options shared by every sitemap parse: never expand entities or touch
+# the network, skip whitespace-only text nodes, and lift libxml2's size limits
+# so very large sitemap indexes don't fail part way through
+SITEMAP_PARSER_OPTIONS = {
+    'resolve_entities': False,
+    'no_network': True,
+    'remove_blank_text': True,
+    'huge_tree': True,
+}
+
+# Sitemap: directives in robots.txt
+SITEMAP_DIRECTIVE_RE = re.compile(rb'^[ \t]*sitemap[ \t]*:[ \t]*(\S+)', re.IGNORECASE | re.MULTILINE)
+
+
+@dataclass(**DATACLASS_SLOTS)
 class SitemapURL:
     """Represents a URL from sitemap"""
     loc: str
@@ -29,7 +48,7 @@ class SitemapURL:
         }
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class SitemapResult:
     """Result of sitemap discovery"""
     found: bool = False
@@ -43,11 +62,20 @@ class SitemapResult:
         return {
             'found': self.found,
             'sitemap_urls': self.sitemap_urls,
-            'urls': [u.to_dict() for u in self.urls],
+            # Built inline rather than via SitemapURL.to_dict() - this list
+            # can hold max_urls entries
+            'urls': [
+                {'url': u.loc, 'lastmod': u.lastmod, 'changefreq': u.changefreq, 'priority': u.priority}
+                for u in self.urls
+            ],
             'total_urls': self.total_urls,
             'errors': self.errors,
             'warnings': self.warnings
         }
+    
+    def to_json_bytes(self) -> bytes:
+        """Serialize to UTF-8 JSON without an intermediate str"""
+        return json_dumps_bytes(self.to_dict())
 
 
 class SitemapDiscovery:
@@ -75,83 +103,110 @@ class SitemapDiscovery:
         '/wp-sitemap.xml',
     ]
     
-    # XML namespaces for sitemaps
-    NAMESPACES = {
-        'sm': 'http://www.sitemaps.org/schemas/sitemap/0.9',
-        'xhtml': 'http://www.w3.org/1999/xhtml'
-    }
+    # Content-Type fragments that identify a sitemap response
+    SITEMAP_CONTENT_TYPES = ['xml', 'gzip']
+    
+    # Content-Types too generic to rule a sitemap out from headers alone
+    AMBIGUOUS_CONTENT_TYPES = ('text/plain', 'application/octet-stream')
+    
+    # URL path suffixes that indicate a sitemap document
+    SITEMAP_EXTENSIONS = ('.xml', '.xml.gz', '.gz')
     
-    def __init__(self, max_urls: int = 1000, max_sitemaps: int = 20):
+    def __init__(self, max_urls: int = 1000, max_sitemaps: int = 20, max_workers: int = 8,
+                 http_client: Optional[HTTPClient] = None):
         """
         Initialize sitemap discovery
         
         Args:
             max_urls: Maximum URLs to collect
             max_sitemaps: Maximum sitemap files to process
+            max_workers: Maximum concurrent sitemap fetches
+            http_client: Shared HTTP client (a new one is created if None)
         """
-        self.http_client = HTTPClient(timeout=15)
+        self.http_client = http_client or HTTPClient(timeout=15)
         self.max_urls = max_urls
         self.max_sitemaps = max_sitemaps
+        self.max_workers = max_workers
     
-    def discover(self, base_url: str) -> SitemapResult:
+    def discover(self, base_url: str,
+                 robots_response: Optional[requests.Response] = None) -> SitemapResult:
         """
         Discover sitemaps for a website
         
         Args:
             base_url: Base URL of the website
+            robots_response: Already fetched response for /robots.txt
             
         Returns:
             SitemapResult with discovered URLs
         """
         result = SitemapResult()
-        parsed_url = urlparse(base_url)
-        base = f"{parsed_url.scheme}://{parsed_url.netloc}"
+        base = url_origin(base_url)
         
-        # Track processed sitemaps to avoid duplicates
+        # Track every sitemap ever queued so each is fetched at most once
         processed_sitemaps: Set[str] = set()
+        queued_sitemaps: Set[str] = set()
         sitemap_queue: List[str] = []
         
+        def enqueue(sitemap_url: str) -> None:
+            if sitemap_url not in queued_sitemaps:
+                queued_sitemaps.add(sitemap_url)
+                sitemap_queue.append(sitemap_url)
+        
         print(f"  [+] Discovering sitemaps for {base}...")
         
         # First, check robots.txt for sitemap hints
-        robots_sitemaps = self._get_sitemaps_from_robots(base)
-        sitemap_queue.extend(robots_sitemaps)
+        for sitemap_url in self._get_sitemaps_from_robots(base, robots_response):
+            enqueue(sitemap_url)
         
         # Add common sitemap paths
         for path in self.COMMON_PATHS:
-            sitemap_url = urljoin(base, path)
-            if sitemap_url not in sitemap_queue:
-                sitemap_queue.append(sitemap_url)
+            enqueue(join_url(base, path))
         
-        # Process sitemap queue
-        while sitemap_queue and len(processed_sitemaps) < self.max_sitemaps:
-            sitemap_url = sitemap_queue.pop(0)
-            
-            if sitemap_url in processed_sitemaps:
-                continue
-            
-            processed_sitemaps.add(sitemap_url)
+        # Fetch sitemaps on the pool, keeping at most max_workers in flight,
+        # and collect URLs on this thread as each one completes
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            pending: Dict[Future, str] = {}
             
-            # Fetch and parse sitemap
-            sitemap_data = self._fetch_sitemap(sitemap_url)
+            def submit_queued() -> None:
+                while (sitemap_queue and len(pending) < self.max_workers
+                       and len(processed_sitemaps) < self.max_sitemaps):
+                    sitemap_url = sitemap_queue.pop(0)
+                    processed_sitemaps.add(sitemap_url)
+                    pending[executor.submit(self._fetch_sitemap, sitemap_url)] = sitemap_url
             
-            if sitemap_data is None:
-                continue
+            submit_queued()
             
-            result.found = True
-            result.sitemap_urls.append(sitemap_url)
-            
-            # Check if it's a sitemap index
-            if sitemap_data.get('is_index', False):
-                # Add child sitemaps to queue
-                for child_url in sitemap_data.get('sitemaps', []):
-                    if child_url not in processed_sitemaps:
-                        sitemap_queue.append(child_url)
-            else:
-                # Add URLs
-                for url_data in sitemap_data.get('urls', []):
-                    if len(result.urls) < self.max_urls:
-                        result.urls.append(url_data)
+            while pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                
+                for future in done:
+                    sitemap_url = pending.pop(future)
+                    sitemap_data = future.result()
+                    
+                    if sitemap_data is None:
+                        continue
+                    
+                    result.found = True
+                    result.sitemap_urls.append(sitemap_url)
+                    
+                    # Check if it's a sitemap index
+                    if sitemap_data.get('is_index', False):
+                        # Add child sitemaps to queue
+                        for child_url in sitemap_data.get('sitemaps', []):
+                            enqueue(child_url)
+                    else:
+                        # Add URLs
+                        for url_data in sitemap_data.get('urls', []):
+                            if len(result.urls) < self.max_urls:
+                                result.urls.append(url_data)
+                
+                if len(result.urls) >= self.max_urls:
+                    for future in pending:
+                        future.cancel()
+                    break
+                
+                submit_queued()
         
         result.total_urls = len(result.urls)
         
@@ -163,31 +218,28 @@ class SitemapDiscovery:
         
         return result
     
-    def _get_sitemaps_from_robots(self, base_url: str) -> List[str]:
+    def _get_sitemaps_from_robots(self, base_url: str,
+                                  response: Optional[requests.Response] = None) -> List[str]:
         """
         Get sitemap URLs from robots.txt
         
         Args:
             base_url: Base URL
+            response: Already fetched robots.txt response (fetched if None)
             
         Returns:
             List of sitemap URLs
         """
         sitemaps = []
-        robots_url = urljoin(base_url, '/robots.txt')
+        robots_url = join_url(base_url, '/robots.txt')
         
         try:
-            response = self.http_client.get(robots_url)
+            if response is None:
+                response = self.http_client.get(robots_url)
             if response and response.status_code == 200:
-                content = response.text
-                
-                # Find Sitemap: directives (case-insensitive)
-                for line in content.split('\n'):
-                    line = line.strip()
-                    if line.lower().startswith('sitemap:'):
-                        sitemap_url = line.split(':', 1)[1].strip()
-                        if sitemap_url:
-                            sitemaps.append(sitemap_url)
+                # Find Sitemap: directives (case-insensitive) in one pass over the body
+                for match in SITEMAP_DIRECTIVE_RE.finditer(response.content):
+                    sitemaps.append(match.group(1).decode('utf-8', errors='replace'))
         except Exception as e:
             pass  # Silently fail - robots.txt might not exist
         
@@ -203,112 +255,206 @@ class SitemapDiscovery:
         Returns:
             Parsed sitemap data or None
         """
+        cache_key = f"sitemap:{url}"
+        if cache_key in probe_miss_cache:
+            return None
+        
+        sitemap_data = self._fetch_sitemap_uncached(url)
+        if sitemap_data is None:
+            probe_miss_cache.add(cache_key)
+        
+        return sitemap_data
+    
+    def _fetch_sitemap_uncached(self, url: str) -> Optional[Dict[str, Any]]:
+        """Fetch and parse a sitemap, bypassing the negative cache"""
         try:
+            if not self._head_may_be_sitemap(url):
+                return None
+            
             # Handle gzipped sitemaps
-            headers = {}
             if url.endswith('.gz'):
-                headers['Accept-Encoding'] = 'gzip'
+                return self._fetch_gzipped_sitemap(url)
             
             response = self.http_client.get(url)
             
             if not response or response.status_code != 200:
                 return None
             
-            content = response.content
-            
-            # Try to parse as XML
-            try:
-                root = etree.fromstring(content)
-            except etree.XMLSyntaxError:
-                return None
-            
-            # Check if it's a sitemap index
-            if root.tag.endswith('sitemapindex'):
-                return self._parse_sitemap_index(root)
-            elif root.tag.endswith('urlset'):
-                return self._parse_urlset(root)
+            return self._parse_sitemap(io.BytesIO(response.content))
             
+        except Exception as e:
             return None
+    
+    def _fetch_gzipped_sitemap(self, url: str) -> Optional[Dict[str, Any]]:
+        """
+        Fetch a .gz sitemap and decompress it straight into the XML parser
+        
+        Args:
+            url: Sitemap URL
             
-        except Exception as e:
+        Returns:
+            Parsed sitemap data or None
+        """
+        response = self.http_client.get(url, stream=True)
+        
+        if not response or response.status_code != 200:
             return None
+        
+        try:
+            # Let urllib3 undo any transport Content-Encoding, and keep the raw
+            # stream open at EOF so the buffered/gzip wrappers can finish reading
+            response.raw.decode_content = True
+            response.raw.auto_close = False
+            stream = io.BufferedReader(response.raw, buffer_size=64 * 1024)
+            
+            # Some servers hand out the already-decompressed XML
+            if stream.peek(2)[:2] == b'\x1f\x8b':
+                stream = gzip.GzipFile(fileobj=stream)
+            
+            return self._parse_sitemap(stream)
+        finally:
+            response.close()
     
-    def _parse_sitemap_index(self, root: etree._Element) -> Dict[str, Any]:
-        """Parse sitemap index XML"""
-        sitemaps = []
+    def _head_may_be_sitemap(self, url: str) -> bool:
+        """
+        Rule out obvious non-sitemaps from a HEAD request before downloading the body
         
-        for sitemap in root.findall('.//sm:sitemap', self.NAMESPACES):
-            loc = sitemap.find('sm:loc', self.NAMESPACES)
-            if loc is not None and loc.text:
-                sitemaps.append(loc.text.strip())
+        Args:
+            url: Sitemap URL
+            
+        Returns:
+            False if the headers show the URL is not a sitemap, True otherwise
+        """
+        response = self.http_client.head(url, allow_redirects=True)
         
-        # Also try without namespace (some sites don't use it)
-        if not sitemaps:
-            for sitemap in root.findall('.//sitemap'):
-                loc = sitemap.find('loc')
-                if loc is not None and loc.text:
-                    sitemaps.append(loc.text.strip())
+        # HEAD unsupported or failed - let the GET decide
+        if response is None:
+            return True
         
-        return {
-            'is_index': True,
-            'sitemaps': sitemaps
-        }
+        if response.status_code in (404, 410):
+            return False
+        
+        if response.status_code != 200:
+            return True
+        
+        content_type = response.headers.get('Content-Type', '').lower()
+        
+        if not content_type or content_type.startswith(self.AMBIGUOUS_CONTENT_TYPES):
+            return True
+        
+        if any(ct in content_type for ct in self.SITEMAP_CONTENT_TYPES):
+            return True
+        
+        return urlparse(url).path.lower().endswith(self.SITEMAP_EXTENSIONS)
     
-    def _parse_urlset(self, root: etree._Element) -> Dict[str, Any]:
-        """Parse urlset XML"""
-        urls = []
-        
-        for url in root.findall('.//sm:url', self.NAMESPACES):
-            loc = url.find('sm:loc', self.NAMESPACES)
-            if loc is not None and loc.text:
-                sitemap_url = SitemapURL(loc=loc.text.strip())
+    def _parse_sitemap(self, source) -> Optional[Dict[str, Any]]:
+        """
+        Stream-parse a sitemap or sitemap index
+        
+        Each <url>/<sitemap> element is read as soon as it is complete and
+        then released, so memory stays flat regardless of sitemap size and
+        parsing stops once max_urls URLs have been collected.
+        
+        Args:
+            source: File-like object with the sitemap XML
+            
+        Returns:
+            Parsed sitemap data or None if not a sitemap
+        """
+        context = etree.iterparse(
+            source,
+            events=('start', 'end'),
+            tag=('{*}urlset', '{*}sitemapindex', '{*}url', '{*}sitemap'),
+            **SITEMAP_PARSER_OPTIONS
+        )
+        
+        is_index = None
+        sitemaps: List[str] = []
+        urls: List[SitemapURL] = []
+        
+        try:
+            for event, elem in context:
+                tag = self._local_name(elem)
                 
-                lastmod = url.find('sm:lastmod', self.NAMESPACES)
-                if lastmod is not None and lastmod.text:
-                    sitemap_url.lastmod = lastmod.text.strip()
+                if event == 'start':
+                    # The root element decides between index and urlset
+                    if is_index is None:
+                        if tag == 'sitemapindex':
+                            is_index = True
+                        elif tag == 'urlset':
+                            is_index = False
+                        else:
+                            return None
+                    continue
                 
-                changefreq = url.find('sm:changefreq', self.NAMESPACES)
-                if changefreq is not None and changefreq.text:
-                    sitemap_url.changefreq = changefreq.text.strip()
+                if tag == 'sitemap' and is_index:
+                    loc = self._child_text(elem, 'loc')
+                    if loc:
+                        sitemaps.append(loc)
+                elif tag == 'url' and is_index is False:
+                    sitemap_url = self._sitemap_url_from_element(elem)
+                    if sitemap_url:
+                        urls.append(sitemap_url)
+                else:
+                    continue
                 
-                priority = url.find('sm:priority', self.NAMESPACES)
-                if priority is not None and priority.text:
-                    try:
-                        sitemap_url.priority = float(priority.text.strip())
-                    except ValueError:
-                        pass
+                elem.clear()
+                while elem.getprevious() is not None:
+                    del elem.getparent()[0]
                 
-                urls.append(sitemap_url)
-        
-        # Also try without namespace
-        if not urls:
-            for url in root.findall('.//url'):
-                loc = url.find('loc')
-                if loc is not None and loc.text:
-                    sitemap_url = SitemapURL(loc=loc.text.strip())
-                    
-                    lastmod = url.find('lastmod')
-                    if lastmod is not None and lastmod.text:
-                        sitemap_url.lastmod = lastmod.text.strip()
-                    
-                    changefreq = url.find('changefreq')
-                    if changefreq is not None and changefreq.text:
-                        sitemap_url.changefreq = changefreq.text.strip()
-                    
-                    priority = url.find('priority')
-                    if priority is not None and priority.text:
-                        try:
-                            sitemap_url.priority = float(priority.text.strip())
-                        except ValueError:
-                            pass
-                    
-                    urls.append(sitemap_url)
+                if len(urls) >= self.max_urls:
+                    break
+        except etree.XMLSyntaxError:
+            # Keep whatever was read before a truncated or malformed tail
+            if not sitemaps and not urls:
+                return None
+        
+        if is_index is None:
+            return None
+        
+        if is_index:
+            return {
+                'is_index': True,
+                'sitemaps': sitemaps
+            }
         
         return {
             'is_index': False,
             'urls': urls
         }
     
+    @staticmethod
+    def _local_name(elem: etree._Element) -> str:
+        """Get element tag name without its XML namespace"""
+        return elem.tag.rsplit('}', 1)[-1]
+    
+    def _child_text(self, elem: etree._Element, name: str) -> Optional[str]:
+        """Get stripped text of the first direct child with the given local name"""
+        for child in elem:
+            if isinstance(child.tag, str) and self._local_name(child) == name:
+                text = (child.text or '').strip()
+                return text or None
+        return None
+    
+    def _sitemap_url_from_element(self, elem: etree._Element) -> Optional[SitemapURL]:
+        """Build a SitemapURL from a <url> element"""
+        loc = self._child_text(elem, 'loc')
+        if not loc:
+            return None
+        
+        sitemap_url = SitemapURL(loc=loc)
+        sitemap_url.lastmod = self._child_text(elem, 'lastmod')
+        sitemap_url.changefreq = self._child_text(elem, 'changefreq')
+        
+        priority = self._child_text(elem, 'priority')
+        if priority:
+            try:
+                sitemap_url.priority = float(priority)
+            except ValueError:
+                pass
+        
+        return sitemap_url
+    
     def get_urls_by_pattern(self, result: SitemapResult, pattern: str) -> List[SitemapURL]:
         """
         Filter URLs by regex pattern
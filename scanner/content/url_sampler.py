@@ -3,13 +3,36 @@ URL Sampler Module
 Provides intelligent URL sampling for efficient scanning
 """
 
-from typing import Dict, Any, List, Optional, Set
+from typing import Dict, Any, Iterable, Iterator, List, Optional, Set
 from urllib.parse import urlparse, urljoin
 from dataclasses import dataclass, field
 from enum import Enum
+from functools import lru_cache
+from itertools import chain
 import re
-from bs4 import BeautifulSoup
+
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
+try:
+    from selectolax.lexbor import LexborHTMLParser
+    SELECTOLAX_AVAILABLE = True
+except ImportError:
+    SELECTOLAX_AVAILABLE = False
+
+from lxml import etree
+from utils.helpers import DATACLASS_SLOTS
 from utils.http_client import HTTPClient
+from utils.logger import get_module_logger
+
+logger = get_module_logger(__name__)
+
+
+# Regex source that is really a plain string: no metacharacters except escaped punctuation
+_LITERAL_PATTERN_RE = re.compile(r'(?:[^\\.^$*+?{}\[\]|()]|\\[^\w])+')
 
 
 class URLType(Enum):
@@ -22,7 +45,7 @@ class URLType(Enum):
     OTHER = "other"
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class SampledURL:
     """Represents a sampled URL"""
     url: str
@@ -41,7 +64,7 @@ class SampledURL:
         }
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class SamplerResult:
     """Result of URL sampling"""
     homepage: Optional[str] = None
@@ -49,7 +72,12 @@ class SamplerResult:
     products: List[SampledURL] = field(default_factory=list)
     categories: List[SampledURL] = field(default_factory=list)
     pages: List[SampledURL] = field(default_factory=list)
-    all_urls: List[SampledURL] = field(default_factory=list)
+    total_urls: int = 0
+    
+    @property
+    def all_urls(self) -> List[SampledURL]:
+        """Every sampled URL across the per-type lists"""
+        return self.articles + self.products + self.categories + self.pages
     
     def to_dict(self) -> Dict[str, Any]:
         return {
@@ -58,7 +86,7 @@ class SamplerResult:
             'products': [u.to_dict() for u in self.products],
             'categories': [u.to_dict() for u in self.categories],
             'pages': [u.to_dict() for u in self.pages],
-            'total_urls': len(self.all_urls)
+            'total_urls': self.total_urls
         }
 
 
@@ -145,31 +173,107 @@ class URLSampler:
         r'\?',
     ]
     
-    def __init__(self, max_per_type: int = 10, max_depth: int = 2):
+    def __init__(self, max_per_type: int = 10, max_depth: int = 2,
+                 http_client: Optional[HTTPClient] = None):
         """
         Initialize URL sampler
         
         Args:
             max_per_type: Maximum URLs to sample per type
             max_depth: Maximum crawl depth
+            http_client: Shared HTTP client (a new one is created if None)
         """
-        self.http_client = HTTPClient(timeout=10)
+        self.http_client = http_client or HTTPClient(timeout=10)
         self.max_per_type = max_per_type
         self.max_depth = max_depth
-        self._compiled_patterns = self._compile_patterns()
+        (self._rule_types, self._split_rules,
+         self._literal_automaton, self._regex_rules) = self._compiled_matchers()
     
-    def _compile_patterns(self) -> Dict[str, List[re.Pattern]]:
-        """Compile regex patterns"""
-        return {
-            'article': [re.compile(p, re.I) for p in self.ARTICLE_PATTERNS],
-            'product': [re.compile(p, re.I) for p in self.PRODUCT_PATTERNS],
-            'category': [re.compile(p, re.I) for p in self.CATEGORY_PATTERNS],
-            'page': [re.compile(p, re.I) for p in self.PAGE_PATTERNS],
-            'skip': [re.compile(p, re.I) for p in self.SKIP_PATTERNS],
-        }
+    @classmethod
+    @lru_cache(maxsize=None)
+    def _compiled_matchers(cls) -> tuple:
+        """
+        Compile the classification tables once per class
+        
+        Returns:
+            (rule_types, split_rules, automaton, regex_rules), shared by
+            every instance since the pattern lists are class constants
+        """
+        rules = cls._classification_rules()
+        split_rules = cls._split_patterns(rules)
+        automaton, regex_rules = cls._build_matcher(split_rules)
+        return [url_type for _, url_type in rules], split_rules, automaton, regex_rules
+    
+    @classmethod
+    def _classification_rules(cls) -> List[tuple]:
+        """Pattern lists with their resulting URLType, in match priority order"""
+        return [
+            (cls.SKIP_PATTERNS, URLType.OTHER),
+            (cls.PRODUCT_PATTERNS, URLType.PRODUCT),
+            (cls.ARTICLE_PATTERNS, URLType.ARTICLE),
+            (cls.CATEGORY_PATTERNS, URLType.CATEGORY),
+            (cls.PAGE_PATTERNS, URLType.PAGE),
+        ]
+    
+    @staticmethod
+    def _split_patterns(rules: List[tuple]) -> List[tuple]:
+        """
+        Split each rule into plain substrings and patterns needing the regex engine
+        
+        Args:
+            rules: (patterns, URLType) pairs in priority order
+            
+        Returns:
+            List of (literals, regexes) per rule in priority order, where
+            literals is a tuple of lowercase strings for ``in`` checks
+        """
+        split_rules = []
+        for patterns, _ in rules:
+            literals = []
+            regexes = []
+            for pattern in patterns:
+                if _LITERAL_PATTERN_RE.fullmatch(pattern):
+                    literal = re.sub(r'\\(.)', r'\1', pattern).lower()
+                    if literal not in literals:
+                        literals.append(literal)
+                else:
+                    regexes.append(re.compile(pattern, re.I))
+            split_rules.append((tuple(literals), tuple(regexes)))
+        return split_rules
+    
+    @staticmethod
+    def _build_matcher(split_rules: List[tuple]) -> tuple:
+        """
+        Build an Aho-Corasick automaton over the literal patterns
+        
+        Args:
+            split_rules: (literals, regexes) per rule from _split_patterns
+            
+        Returns:
+            (automaton, regex_rules) where the automaton maps each lowercase
+            literal to its priority rank and regex_rules lists
+            (rank, compiled pattern) for patterns that need the regex engine.
+            The automaton is None when pyahocorasick is not installed.
+        """
+        if not AHOCORASICK_AVAILABLE:
+            return None, []
+        
+        automaton = ahocorasick.Automaton()
+        regex_rules = []
+        
+        for rank, (literals, regexes) in enumerate(split_rules):
+            for literal in literals:
+                # Keep the highest-priority rank for literals listed twice
+                if literal not in automaton:
+                    automaton.add_word(literal, rank)
+            regex_rules.extend((rank, pattern) for pattern in regexes)
+        
+        automaton.make_automaton()
+        return automaton, regex_rules
     
     def sample(self, base_url: str, sitemap_urls: List[str] = None,
-               rss_urls: List[str] = None, max_crawl: int = 50) -> SamplerResult:
+               rss_urls: List[str] = None, max_crawl: int = 50,
+               homepage_html: Optional[str] = None) -> SamplerResult:
         """
         Sample URLs from a website
         
@@ -178,6 +282,7 @@ class URLSampler:
             sitemap_urls: URLs from sitemap discovery
             rss_urls: URLs from RSS discovery
             max_crawl: Maximum URLs to crawl from homepage
+            homepage_html: Already fetched homepage HTML (fetched if None)
             
         Returns:
             SamplerResult with sampled URLs
@@ -185,27 +290,34 @@ class URLSampler:
         result = SamplerResult(homepage=base_url)
         seen_urls: Set[str] = set()
         
-        print(f"  [+] Sampling URLs from {base_url}...")
+        logger.info("  [+] Sampling URLs from %s...", base_url)
         
-        # Process sitemap URLs first (highest priority)
-        if sitemap_urls:
-            for url in sitemap_urls:
-                if len(result.all_urls) >= self.max_per_type * 5:
-                    break
-                self._classify_and_add(url, result, seen_urls, source='sitemap')
+        def sitemap_source():
+            for url in sitemap_urls or []:
+                if result.total_urls >= self.max_per_type * 5:
+                    return
+                yield url, 'sitemap', None
         
-        # Process RSS URLs
-        if rss_urls:
-            for url in rss_urls:
+        def rss_source():
+            for url in rss_urls or []:
                 if len(result.articles) >= self.max_per_type:
-                    break
-                self._classify_and_add(url, result, seen_urls, source='rss', force_type=URLType.ARTICLE)
+                    return
+                yield url, 'rss', URLType.ARTICLE
+        
+        # Sitemap URLs first (highest priority), then RSS items, sharing one
+        # early exit once every bucket is full
+        for url, source, force_type in chain(sitemap_source(), rss_source()):
+            if self._all_buckets_full(result):
+                break
+            self._classify_and_add(url, result, seen_urls, source=source, force_type=force_type)
         
         # Crawl homepage for additional URLs if needed
         if (len(result.articles) < self.max_per_type or 
             len(result.products) < self.max_per_type):
-            crawled_urls = self._crawl_for_urls(base_url, max_crawl, seen_urls)
+            crawled_urls = self._crawl_for_urls(base_url, max_crawl, seen_urls, homepage_html)
             for url in crawled_urls:
+                if self._all_buckets_full(result):
+                    break
                 self._classify_and_add(url, result, seen_urls, source='crawl')
         
         # Sort by priority
@@ -220,44 +332,68 @@ class URLSampler:
         result.categories = result.categories[:self.max_per_type]
         result.pages = result.pages[:self.max_per_type]
         
-        print(f"  [+] Sampled: {len(result.articles)} articles, {len(result.products)} products, "
-              f"{len(result.categories)} categories, {len(result.pages)} pages")
+        logger.info("  [+] Sampled: %d articles, %d products, %d categories, %d pages",
+                    len(result.articles), len(result.products),
+                    len(result.categories), len(result.pages))
         
         return result
     
-    def _classify_url(self, url: str) -> URLType:
+    def _all_buckets_full(self, result: SamplerResult) -> bool:
+        """Check whether every per-type list has reached max_per_type"""
+        return (len(result.articles) >= self.max_per_type and
+                len(result.products) >= self.max_per_type and
+                len(result.categories) >= self.max_per_type and
+                len(result.pages) >= self.max_per_type)
+    
+    def _classify_url(self, url: str, trust_source: bool = False) -> URLType:
         """
         Classify URL by type based on patterns
         
         Args:
             url: URL to classify
+            trust_source: Skip the skip-patterns for URLs from a vetted
+                source such as the site's own sitemap
             
         Returns:
             URLType
         """
-        # Check if should skip
-        for pattern in self._compiled_patterns['skip']:
-            if pattern.search(url):
-                return URLType.OTHER
+        # Skip patterns are rule 0, so trusted URLs start at rule 1
+        first_rule = 1 if trust_source else 0
         
-        # Check patterns in priority order
-        for pattern in self._compiled_patterns['product']:
-            if pattern.search(url):
-                return URLType.PRODUCT
+        if self._literal_automaton is not None:
+            return self._classify_url_automaton(url, first_rule)
         
-        for pattern in self._compiled_patterns['article']:
-            if pattern.search(url):
-                return URLType.ARTICLE
+        # Rules are in priority order and skip patterns map to OTHER
+        url_lower = url.lower()
+        for url_type, (literals, regexes) in zip(self._rule_types[first_rule:],
+                                                 self._split_rules[first_rule:]):
+            for literal in literals:
+                if literal in url_lower:
+                    return url_type
+            for pattern in regexes:
+                if pattern.search(url):
+                    return url_type
         
-        for pattern in self._compiled_patterns['category']:
-            if pattern.search(url):
-                return URLType.CATEGORY
+        return URLType.OTHER
+    
+    def _classify_url_automaton(self, url: str, first_rule: int = 0) -> URLType:
+        """Classify URL with one Aho-Corasick pass plus the few regex-only patterns"""
+        best = len(self._rule_types)
+        for _, rank in self._literal_automaton.iter(url.lower()):
+            if first_rule <= rank < best:
+                best = rank
+                if best == first_rule:
+                    break
         
-        for pattern in self._compiled_patterns['page']:
-            if pattern.search(url):
-                return URLType.PAGE
+        # A regex pattern only matters if it outranks the best literal hit
+        for rank, pattern in self._regex_rules:
+            if rank >= best:
+                break
+            if rank >= first_rule and pattern.search(url):
+                best = rank
+                break
         
-        return URLType.OTHER
+        return self._rule_types[best] if best < len(self._rule_types) else URLType.OTHER
     
     def _classify_and_add(self, url: str, result: SamplerResult, seen: Set[str],
                           source: str = 'crawl', force_type: URLType = None,
@@ -279,31 +415,39 @@ class URLSampler:
         
         seen.add(url)
         
-        url_type = force_type or self._classify_url(url)
+        url_type = force_type or self._classify_url(url, trust_source=(source == 'sitemap'))
         
         if url_type == URLType.OTHER:
             return
         
-        sampled = SampledURL(
-            url=url,
-            url_type=url_type,
-            depth=depth,
-            source=source,
-            priority=priority
-        )
-        
-        result.all_urls.append(sampled)
+        result.total_urls += 1
         
         if url_type == URLType.ARTICLE:
-            result.articles.append(sampled)
+            bucket = result.articles
         elif url_type == URLType.PRODUCT:
-            result.products.append(sampled)
+            bucket = result.products
         elif url_type == URLType.CATEGORY:
-            result.categories.append(sampled)
+            bucket = result.categories
         elif url_type == URLType.PAGE:
-            result.pages.append(sampled)
+            bucket = result.pages
+        else:
+            return
+        
+        # sample() keeps the first max_per_type URLs of each bucket after a
+        # stable sort by priority. Every caller uses the same priority, so
+        # URLs past the cap would be trimmed anyway. Distinct priorities
+        # would need this check removed.
+        if len(bucket) < self.max_per_type:
+            bucket.append(SampledURL(
+                url=url,
+                url_type=url_type,
+                depth=depth,
+                source=source,
+                priority=priority
+            ))
     
-    def _crawl_for_urls(self, base_url: str, max_urls: int, seen: Set[str]) -> List[str]:
+    def _crawl_for_urls(self, base_url: str, max_urls: int, seen: Set[str],
+                        html_content: Optional[str] = None) -> List[str]:
         """
         Light crawl to discover URLs
         
@@ -311,53 +455,146 @@ class URLSampler:
             base_url: Base URL
             max_urls: Maximum URLs to find
             seen: Already seen URLs
+            html_content: Already fetched page HTML (fetched if None)
             
         Returns:
             List of discovered URLs
         """
         discovered = []
+        discovered_set: Set[str] = set()
         parsed_base = urlparse(base_url)
         base_domain = parsed_base.netloc
+        base_prefix = f"{parsed_base.scheme}://{base_domain}"
+        
+        response = None
         
         try:
-            response = self.http_client.get(base_url)
-            if not response or response.status_code != 200:
-                return discovered
-            
-            soup = BeautifulSoup(response.text, 'html.parser')
+            if html_content is None:
+                # Stream the body into the pull parser rather than holding it all
+                response = self.http_client.get(base_url, stream=True)
+                if not response or response.status_code != 200:
+                    return discovered
+                
+                content_type = response.headers.get('Content-Type', '').lower()
+                # Without a header charset, let lxml pick it up from <meta>
+                encoding = response.encoding if 'charset' in content_type else None
+                hrefs = self._iter_anchor_hrefs(response.iter_content(chunk_size=8192), encoding)
+            elif SELECTOLAX_AVAILABLE:
+                # Whole document already in memory: lexbor parses it fastest
+                hrefs = (
+                    node.attributes.get('href')
+                    for node in LexborHTMLParser(html_content).css('a[href]')
+                )
+            else:
+                hrefs = self._iter_anchor_hrefs((html_content,))
             
-            for link in soup.find_all('a', href=True):
+            for href in hrefs:
                 if len(discovered) >= max_urls:
                     break
                 
-                href = link.get('href', '')
-                
                 # Skip empty or javascript links
                 if not href or href.startswith(('javascript:', 'mailto:', 'tel:', '#')):
                     continue
                 
-                # Resolve relative URLs
-                full_url = urljoin(base_url, href)
+                normalized = self._normalize_same_site_href(href, base_prefix)
                 
-                # Parse and validate
-                parsed = urlparse(full_url)
+                if normalized is None:
+                    # Resolve relative URLs
+                    full_url = urljoin(base_url, href)
+                    
+                    # Parse and validate
+                    parsed = urlparse(full_url)
+                    
+                    # Only same domain
+                    if parsed.netloc != base_domain:
+                        continue
+                    
+                    # Normalize URL (remove fragment, trailing slash)
+                    normalized = f"{parsed.scheme}://{parsed.netloc}{parsed.path}"
+                    normalized = normalized.rstrip('/')
                 
-                # Only same domain
-                if parsed.netloc != base_domain:
-                    continue
-                
-                # Normalize URL (remove fragment, trailing slash)
-                normalized = f"{parsed.scheme}://{parsed.netloc}{parsed.path}"
-                normalized = normalized.rstrip('/')
-                
-                if normalized not in seen and normalized not in discovered:
+                if normalized not in seen and normalized not in discovered_set:
                     discovered.append(normalized)
+                    discovered_set.add(normalized)
         
         except Exception as e:
             pass
+        finally:
+            if response is not None:
+                response.close()
         
         return discovered
     
+    @staticmethod
+    def _iter_anchor_hrefs(chunks: Iterable, encoding: Optional[str] = None) -> Iterator[str]:
+        """
+        Yield <a href> values while HTML chunks are fed to lxml's pull parser
+        
+        Args:
+            chunks: str or bytes pieces of the document
+            encoding: Encoding of bytes chunks
+            
+        Yields:
+            Non-empty href attribute values in document order
+        """
+        parser = etree.HTMLPullParser(events=('start', 'end'), encoding=encoding)
+        
+        def drain() -> Iterator[str]:
+            for event, elem in parser.read_events():
+                if event == 'start':
+                    if elem.tag == 'a':
+                        href = elem.get('href')
+                        if href:
+                            yield href
+                    continue
+                
+                # Finished elements and their earlier siblings are never needed
+                # again, so only the path to the current element stays built
+                elem.clear()
+                while elem.getprevious() is not None:
+                    del elem.getparent()[0]
+        
+        for chunk in chunks:
+            parser.feed(chunk)
+            yield from drain()
+        
+        try:
+            parser.close()
+        except etree.XMLSyntaxError:
+            return  # Empty document
+        
+        yield from drain()
+    
+    @staticmethod
+    def _normalize_same_site_href(href: str, base_prefix: str) -> Optional[str]:
+        """
+        Normalize root-relative or same-origin hrefs without urljoin/urlparse
+        
+        Args:
+            href: Raw href attribute
+            base_prefix: scheme://netloc of the crawled page
+            
+        Returns:
+            Normalized URL, or None when href needs the full urljoin path
+        """
+        if href.startswith(base_prefix):
+            path = href[len(base_prefix):]
+            if not path.startswith('/'):
+                return None
+        elif href.startswith('/') and not href.startswith('//'):
+            path = href
+        else:
+            return None
+        
+        path = path.split('#', 1)[0].split('?', 1)[0]
+        
+        # Dot segments, ;params and control characters are rewritten by
+        # urljoin/urlparse, so leave those to the slow path
+        if '/.' in path or ';' in path or not path.isprintable():
+            return None
+        
+        return (base_prefix + path).rstrip('/')
+    
     def get_sample_by_type(self, result: SamplerResult, url_type: URLType, 
                            count: int = None) -> List[SampledURL]:
         """
@@ -3,9 +3,13 @@ Content Scanner Module
 Integrated scanner for content discovery, extraction, and advanced SEO analysis
 """
 
+import time
 from typing import Dict, Any, List, Optional
 from urllib.parse import urlparse
+from concurrent.futures import ThreadPoolExecutor
+from utils.helpers import join_url, url_origin
 from utils.http_client import HTTPClient
+from utils.logger import get_module_logger
 
 # Content discovery
 from scanner.content.sitemap_discovery import SitemapDiscovery
@@ -19,6 +23,8 @@ from scanner.seo.schema_validator import SchemaValidator
 from scanner.seo.technical import TechnicalSEO
 from scanner.seo.onpage import OnPageSEO
 
+logger = get_module_logger(__name__)
+
 
 class ContentScanner:
     """
@@ -45,15 +51,16 @@ class ContentScanner:
         self.max_articles = max_articles
         self.max_products = max_products
         
-        # Initialize sub-scanners
-        self.sitemap_discovery = SitemapDiscovery()
-        self.rss_discovery = RSSDiscovery()
-        self.url_sampler = URLSampler()
-        self.article_extractor = ArticleExtractor()
-        self.product_extractor = ProductExtractor()
+        # Initialize sub-scanners, sharing one connection pool so each host
+        # is connected to once per scan rather than once per component
+        self.sitemap_discovery = SitemapDiscovery(http_client=self.http_client)
+        self.rss_discovery = RSSDiscovery(http_client=self.http_client)
+        self.url_sampler = URLSampler(http_client=self.http_client)
+        self.article_extractor = ArticleExtractor(http_client=self.http_client)
+        self.product_extractor = ProductExtractor(http_client=self.http_client)
         self.schema_validator = SchemaValidator()
-        self.technical_seo = TechnicalSEO()
-        self.onpage_seo = OnPageSEO()
+        self.technical_seo = TechnicalSEO(http_client=self.http_client)
+        self.onpage_seo = OnPageSEO(http_client=self.http_client)
     
     def scan(self, url: str) -> Dict[str, Any]:
         """
@@ -76,15 +83,19 @@ class ContentScanner:
             'summary': {}
         }
         
-        print(f"[*] Starting content scan for: {url}")
+        logger.info("[*] Starting content scan for: %s", url)
         
-        # Get homepage HTML for initial analysis
+        # Get homepage HTML and robots.txt once; every phase reuses them.
+        # The fetch is timed here, body included, for technical SEO.
+        start_time = time.time()
         response = self.http_client.get(url)
+        load_time_ms = (time.time() - start_time) * 1000
         homepage_html = response.text if response else None
+        robots_response = self.http_client.get(join_url(url_origin(url), '/robots.txt'))
         
         # 1. Discover sitemaps
-        print(f"\n[*] Phase 1: Content Discovery")
-        sitemap_result = self.sitemap_discovery.discover(url)
+        logger.info("[*] Phase 1: Content Discovery")
+        sitemap_result = self.sitemap_discovery.discover(url, robots_response=robots_response)
         results['discovery']['sitemap'] = sitemap_result.to_dict()
         
         # 2. Discover RSS feeds
@@ -98,54 +109,68 @@ class ContentScanner:
         sampled = self.url_sampler.sample(
             url, 
             sitemap_urls=sitemap_urls,
-            rss_urls=rss_urls
+            rss_urls=rss_urls,
+            homepage_html=homepage_html
         )
         results['discovery']['sampled_urls'] = sampled.to_dict()
         
-        # 4. Extract articles
-        print(f"\n[*] Phase 2: Article Extraction")
         article_urls = [u.url for u in sampled.articles[:self.max_articles]]
-        
-        if article_urls:
-            articles_result = self.article_extractor.extract_from_urls(article_urls)
-            results['articles'] = articles_result.to_dict()
-        else:
-            print("  [-] No article URLs found to analyze")
-            results['articles'] = {'total_found': 0, 'articles': []}
-        
-        # 5. Extract products
-        print(f"\n[*] Phase 3: Product Extraction")
         product_urls = [u.url for u in sampled.products[:self.max_products]]
         
-        if product_urls:
-            products_result = self.product_extractor.extract_from_urls(product_urls)
-            results['products'] = products_result.to_dict()
-        else:
-            print("  [-] No product URLs found to analyze")
-            results['products'] = {'total_found': 0, 'products': []}
-        
-        # 6. Validate schema on homepage
-        print(f"\n[*] Phase 4: Schema Validation")
-        if homepage_html:
-            schema_result = self.schema_validator.validate(homepage_html)
-            results['schema_validation'] = schema_result.to_dict()
-        else:
-            results['schema_validation'] = {'error': 'Could not fetch homepage'}
-        
-        # 7. Technical SEO analysis
-        print(f"\n[*] Phase 5: Technical SEO Analysis")
-        technical_result = self.technical_seo.analyze(url)
-        results['technical_seo'] = technical_result.to_dict()
-        
-        # 8. On-page SEO analysis of homepage
-        print(f"\n[*] Phase 6: On-Page SEO Analysis")
-        onpage_result = self.onpage_seo.analyze(url, homepage_html)
-        results['onpage_seo'] = onpage_result.to_dict()
+        # Phases 2-6 are independent of each other. The network-bound ones
+        # (extraction, technical SEO) run in the background while schema
+        # and on-page analysis of the fetched homepage use this thread.
+        logger.info("[*] Phases 2-6: Extraction and SEO Analysis")
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            articles_future = None
+            products_future = None
+            
+            # 4. Extract articles
+            if article_urls:
+                articles_future = executor.submit(
+                    self.article_extractor.extract_from_urls, article_urls
+                )
+            else:
+                logger.info("  [-] No article URLs found to analyze")
+                results['articles'] = {'total_found': 0, 'articles': []}
+            
+            # 5. Extract products
+            if product_urls:
+                products_future = executor.submit(
+                    self.product_extractor.extract_from_urls, product_urls
+                )
+            else:
+                logger.info("  [-] No product URLs found to analyze")
+                results['products'] = {'total_found': 0, 'products': []}
+            
+            # 7. Technical SEO analysis
+            technical_future = executor.submit(
+                self.technical_seo.analyze, url,
+                response=response, robots_response=robots_response,
+                load_time_ms=load_time_ms
+            )
+            
+            # 6. Validate schema on homepage
+            if homepage_html:
+                schema_result = self.schema_validator.validate(homepage_html)
+                results['schema_validation'] = schema_result.to_dict()
+            else:
+                results['schema_validation'] = {'error': 'Could not fetch homepage'}
+            
+            # 8. On-page SEO analysis of homepage
+            onpage_result = self.onpage_seo.analyze(url, homepage_html)
+            results['onpage_seo'] = onpage_result.to_dict()
+            
+            if articles_future:
+                results['articles'] = articles_future.result().to_dict()
+            if products_future:
+                results['products'] = products_future.result().to_dict()
+            results['technical_seo'] = technical_future.result().to_dict()
         
         # 9. Generate summary
         results['summary'] = self._generate_summary(results)
         
-        print(f"\n[+] Content scan completed!")
+        logger.info("[+] Content scan completed!")
         
         return results
     
@@ -204,9 +229,11 @@ class ContentScanner:
         """
         results = {}
         
-        print(f"[*] Quick scan for: {url}")
+        logger.info("[*] Quick scan for: %s", url)
         
+        start_time = time.time()
         response = self.http_client.get(url)
+        load_time_ms = (time.time() - start_time) * 1000
         if not response:
             return {'error': 'Failed to fetch URL'}
         
@@ -217,7 +244,7 @@ class ContentScanner:
         results['schema'] = schema_result.to_dict()
         
         # Technical SEO
-        technical_result = self.technical_seo.analyze(url)
+        technical_result = self.technical_seo.analyze(url, response=response, load_time_ms=load_time_ms)
         results['technical'] = technical_result.to_dict()
         
         # On-page SEO
@@ -240,7 +267,7 @@ class ContentScanner:
     
     def scan_articles_only(self, url: str) -> Dict[str, Any]:
         """Scan for articles only"""
-        print(f"[*] Scanning articles for: {url}")
+        logger.info("[*] Scanning articles for: %s", url)
         
         response = self.http_client.get(url)
         homepage_html = response.text if response else None
@@ -252,7 +279,9 @@ class ContentScanner:
         sitemap_urls = [u.loc for u in sitemap_result.urls] if sitemap_result.found else []
         rss_urls = [item.url for item in rss_result.items] if rss_result.found else []
         
-        sampled = self.url_sampler.sample(url, sitemap_urls=sitemap_urls, rss_urls=rss_urls)
+        sampled = self.url_sampler.sample(
+            url, sitemap_urls=sitemap_urls, rss_urls=rss_urls, homepage_html=homepage_html
+        )
         
         article_urls = [u.url for u in sampled.articles[:self.max_articles]]
         
@@ -263,7 +292,7 @@ class ContentScanner:
     
     def scan_products_only(self, url: str) -> Dict[str, Any]:
         """Scan for products only"""
-        print(f"[*] Scanning products for: {url}")
+        logger.info("[*] Scanning products for: %s", url)
         
         sitemap_result = self.sitemap_discovery.discover(url)
         
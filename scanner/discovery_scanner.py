@@ -5,12 +5,22 @@ Analyzes robots.txt, sitemap.xml, and performs limited crawl
 """
 
 import re
-import time
+import threading
 import xml.etree.ElementTree as ET
-from typing import Dict, Any, List, Optional, Set
+from collections import Counter
+from itertools import chain
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import lru_cache
+from typing import Dict, Any, List, Optional, Set, Tuple
 from urllib.parse import urljoin, urlparse
-from urllib.request import urlopen, Request
-from urllib.error import URLError, HTTPError
+
+from utils.http_client import HTTPClient
+
+
+@lru_cache(maxsize=4096)
+def _cached_urlparse(url: str):
+    """urlparse() memoized - URLs recur across discovery phases and rescans"""
+    return urlparse(url)
 
 
 class DiscoveryScanner:
@@ -20,6 +30,12 @@ class DiscoveryScanner:
     CRAWL_DELAY = 1.0  # Default delay between requests (seconds)
     MAX_URLS_TO_CRAWL = 50  # Maximum URLs to discover
     REQUEST_TIMEOUT = 10
+    MAX_WORKERS = 8  # Concurrent robots.txt/sitemap fetches
+    MAX_SUB_SITEMAPS = 5  # Sub-sitemaps followed per sitemap index
+    MAX_SITEMAP_DEPTH = 2  # Nested sitemap index levels followed
+    MAX_URLS_PER_CATEGORY = 15
+    SITEMAP_NS = 'http://www.sitemaps.org/schemas/sitemap/0.9'
+    USER_AGENT = 'Mozilla/5.0 (compatible; LinuxSpider/1.4; +https://github.com/m-alizadeh7/linux-spider-webscaning)'
     
     # URL patterns to identify important pages
     MONEY_PAGE_PATTERNS = [
@@ -39,11 +55,72 @@ class DiscoveryScanner:
         r'/category', r'/tag', r'/archive'
     ]
     
-    def __init__(self):
-        """Initialize discovery scanner"""
+    # One robots.txt directive per line: (name, value up to any # comment)
+    _ROBOTS_RE = re.compile(
+        r'^[ \t]*(user-agent|disallow|allow|sitemap|crawl-delay)[ \t]*:[ \t]*([^#\r\n]*)',
+        re.IGNORECASE | re.MULTILINE
+    )
+    
+    COMMON_PAGES = (
+        '/about', '/contact', '/services', '/products',
+        '/blog', '/news', '/faq', '/privacy', '/terms',
+        '/sitemap', '/search'
+    )
+    
+    PRIORITY_ORDER = ('main_pages', 'money_pages', 'blog_pages', 'admin_pages', 'other_pages')
+    
+    MAIN_PAGE_PATHS = frozenset({'/', '/about', '/contact', '/services', '/products', '/home'})
+    
+    # Each pattern list compiled once into a single alternation, so
+    # categorizing a URL is one search per category instead of one per pattern
+    _ADMIN_RE = re.compile('|'.join(ADMIN_PATTERNS))
+    _MONEY_PAGE_RE = re.compile('|'.join(MONEY_PAGE_PATTERNS))
+    _BLOG_RE = re.compile('|'.join(BLOG_PATTERNS))
+    
+    # Disallowed robots.txt paths worth flagging, checked in order
+    _SENSITIVE_PATTERNS = [
+        (re.compile(pattern), message) for pattern, message in [
+            (r'/admin', 'Admin panel path exposed in robots.txt'),
+            (r'/wp-admin', 'WordPress admin path exposed'),
+            (r'/backup', 'Backup directory mentioned'),
+            (r'/config', 'Configuration directory mentioned'),
+            (r'/\.', 'Hidden files/directories mentioned'),
+            (r'/api', 'API endpoints mentioned'),
+            (r'/private', 'Private directory mentioned'),
+            (r'/secret', 'Secret directory mentioned'),
+            (r'/test', 'Test directory mentioned'),
+            (r'/debug', 'Debug directory mentioned'),
+        ]
+    ]
+    # Any of the above in one scan - most disallowed paths match none, and
+    # only those that do walk the ordered list to pick their message
+    _SENSITIVE_RE = re.compile('|'.join(pattern.pattern for pattern, _ in _SENSITIVE_PATTERNS))
+    
+    # Sitemap protocol tags, namespaced or bare. Other <loc> tags (image:loc,
+    # video:loc) are left out so they cannot replace a page location.
+    _SITEMAP_TAGS = {
+        f'{{{SITEMAP_NS}}}loc': 'loc', 'loc': 'loc',
+        f'{{{SITEMAP_NS}}}url': 'url', 'url': 'url',
+        f'{{{SITEMAP_NS}}}sitemap': 'sitemap', 'sitemap': 'sitemap',
+    }
+    
+    def __init__(self, http_client: Optional[HTTPClient] = None):
+        """
+        Initialize discovery scanner
+        
+        Args:
+            http_client: Shared HTTP client (a new one is created if None)
+        """
+        # A pooled keep-alive session, so robots.txt and every sitemap
+        # fetch reuse the same connection to the host
+        self.http_client = http_client or HTTPClient(timeout=self.REQUEST_TIMEOUT)
         self.results = {}
         self.discovered_urls: Set[str] = set()
         self.crawl_delay = self.CRAWL_DELAY
+        # Caps in-flight sitemap requests across nested sitemap indexes
+        self._fetch_slots = threading.Semaphore(self.MAX_WORKERS)
+        # Guards the visited sets shared by sibling sub-sitemap workers
+        self._sitemap_lock = threading.Lock()
         
     def scan(self, url: str) -> Dict[str, Any]:
         """
@@ -59,10 +136,16 @@ class DiscoveryScanner:
         
         base_url = self._normalize_base_url(url)
         
+        # robots.txt and the common sitemap locations are fetched concurrently;
+        # sitemaps listed in robots.txt are tried once it has been parsed
+        with ThreadPoolExecutor(max_workers=self.MAX_WORKERS) as executor:
+            robots_future = executor.submit(self._analyze_robots_txt, base_url)
+            sitemap_result = self._analyze_sitemap(base_url, executor, robots_future)
+        
         results = {
             'base_url': base_url,
-            'robots_txt': self._analyze_robots_txt(base_url),
-            'sitemap': self._analyze_sitemap(base_url),
+            'robots_txt': robots_future.result(),
+            'sitemap': sitemap_result,
             'discovered_urls': [],
             'categorized_urls': {
                 'main_pages': [],
@@ -90,7 +173,7 @@ class DiscoveryScanner:
     
     def _normalize_base_url(self, url: str) -> str:
         """Normalize URL to base format"""
-        parsed = urlparse(url)
+        parsed = _cached_urlparse(url)
         scheme = parsed.scheme or 'https'
         netloc = parsed.netloc or parsed.path.split('/')[0]
         return f"{scheme}://{netloc}"
@@ -120,63 +203,68 @@ class DiscoveryScanner:
         
         try:
             robots_url = f"{base_url}/robots.txt"
-            req = Request(robots_url, headers={
-                'User-Agent': 'Mozilla/5.0 (compatible; LinuxSpider/1.4; +https://github.com/m-alizadeh7/linux-spider-webscaning)'
-            })
+            response = self.http_client.get(robots_url, headers={'User-Agent': self.USER_AGENT})
+            
+            if response is None:
+                print("    ⚠ robots.txt analysis failed: request error")
+                return result
+            
+            if response.status_code == 404:
+                print("    ⚠ robots.txt not found")
+                result['security_insights'].append({
+                    'level': 'info',
+                    'message': 'No robots.txt found - consider adding one for SEO'
+                })
+                return result
+            
+            if response.status_code >= 400:
+                print(f"    ⚠ robots.txt error: HTTP {response.status_code}")
+                return result
+            
+            content = response.content.decode('utf-8', errors='ignore')
             
-            with urlopen(req, timeout=self.REQUEST_TIMEOUT) as response:
-                content = response.read().decode('utf-8', errors='ignore')
-                
             result['exists'] = True
             result['content'] = content[:5000]  # Limit stored content
             
-            # Parse robots.txt
+            # Parse robots.txt: one regex sweep picks out every directive line,
+            # with surrounding whitespace and trailing comments stripped
             current_agent = '*'
-            for line in content.split('\n'):
-                line = line.strip()
-                
-                if not line or line.startswith('#'):
-                    continue
+            for directive, value in self._ROBOTS_RE.findall(content):
+                directive = directive.lower()
+                value = value.rstrip()
                 
-                lower_line = line.lower()
-                
-                if lower_line.startswith('user-agent:'):
-                    current_agent = line.split(':', 1)[1].strip()
+                if directive == 'user-agent':
+                    current_agent = value
                     if current_agent not in result['user_agents']:
                         result['user_agents'].append(current_agent)
                         
-                elif lower_line.startswith('disallow:'):
-                    path = line.split(':', 1)[1].strip()
-                    if path:
+                elif directive == 'disallow':
+                    if value:
                         result['disallowed_paths'].append({
-                            'path': path,
+                            'path': value,
                             'user_agent': current_agent
                         })
                         # Add to discovered URLs
-                        if not path.endswith('*'):
-                            full_url = urljoin(base_url, path)
+                        if not value.endswith('*'):
+                            full_url = urljoin(base_url, value)
                             self.discovered_urls.add(full_url)
                             
-                elif lower_line.startswith('allow:'):
-                    path = line.split(':', 1)[1].strip()
-                    if path:
+                elif directive == 'allow':
+                    if value:
                         result['allowed_paths'].append({
-                            'path': path,
+                            'path': value,
                             'user_agent': current_agent
                         })
                         
-                elif lower_line.startswith('sitemap:'):
-                    sitemap_url = line.split(':', 1)[1].strip()
-                    # Handle case where : splits sitemap URL incorrectly
-                    if sitemap_url.startswith('//'):
-                        sitemap_url = 'https:' + sitemap_url
-                    elif not sitemap_url.startswith('http'):
-                        sitemap_url = 'https:' + line.split('Sitemap:', 1)[1].strip()
-                    result['sitemaps'].append(sitemap_url)
+                elif directive == 'sitemap':
+                    # Sitemap URLs should be absolute; resolve relative or
+                    # scheme-relative ones against the site
+                    if value:
+                        result['sitemaps'].append(urljoin(f"{base_url}/", value))
                     
-                elif lower_line.startswith('crawl-delay:'):
+                elif directive == 'crawl-delay':
                     try:
-                        delay = float(line.split(':', 1)[1].strip())
+                        delay = float(value)
                         result['crawl_delay'] = delay
                         self.crawl_delay = max(delay, self.CRAWL_DELAY)
                     except ValueError:
@@ -187,15 +275,6 @@ class DiscoveryScanner:
             
             print(f"    ✓ Found {len(result['disallowed_paths'])} disallowed paths, {len(result['sitemaps'])} sitemaps")
             
-        except HTTPError as e:
-            if e.code == 404:
-                print("    ⚠ robots.txt not found")
-                result['security_insights'].append({
-                    'level': 'info',
-                    'message': 'No robots.txt found - consider adding one for SEO'
-                })
-            else:
-                print(f"    ⚠ robots.txt error: HTTP {e.code}")
         except Exception as e:
             print(f"    ⚠ robots.txt analysis failed: {e}")
         
@@ -205,23 +284,13 @@ class DiscoveryScanner:
         """Analyze disallowed paths for security insights"""
         insights = []
         
-        sensitive_patterns = {
-            r'/admin': 'Admin panel path exposed in robots.txt',
-            r'/wp-admin': 'WordPress admin path exposed',
-            r'/backup': 'Backup directory mentioned',
-            r'/config': 'Configuration directory mentioned',
-            r'/\.': 'Hidden files/directories mentioned',
-            r'/api': 'API endpoints mentioned',
-            r'/private': 'Private directory mentioned',
-            r'/secret': 'Secret directory mentioned',
-            r'/test': 'Test directory mentioned',
-            r'/debug': 'Debug directory mentioned'
-        }
-        
         for item in disallowed:
             path = item['path'].lower()
-            for pattern, message in sensitive_patterns.items():
-                if re.search(pattern, path):
+            if not self._SENSITIVE_RE.search(path):
+                continue
+            
+            for pattern, message in self._SENSITIVE_PATTERNS:
+                if pattern.search(path):
                     insights.append({
                         'level': 'warning',
                         'path': item['path'],
@@ -231,12 +300,15 @@ class DiscoveryScanner:
         
         return insights
     
-    def _analyze_sitemap(self, base_url: str) -> Dict[str, Any]:
+    def _analyze_sitemap(self, base_url: str, executor: Optional[ThreadPoolExecutor] = None,
+                         robots_future: Optional[Future] = None) -> Dict[str, Any]:
         """
         Analyze sitemap.xml and discover URLs
         
         Args:
             base_url: Base URL of the site
+            executor: Pool to fetch candidate sitemaps on (one is created if None)
+            robots_future: Pending robots.txt analysis whose sitemaps are tried last
             
         Returns:
             Dictionary with sitemap analysis
@@ -261,13 +333,29 @@ class DiscoveryScanner:
             f"{base_url}/wp-sitemap.xml"
         ]
         
-        # Add sitemaps from robots.txt
-        if hasattr(self, 'results') and 'robots_txt' in self.results:
-            sitemap_locations.extend(self.results['robots_txt'].get('sitemaps', []))
+        if executor is None:
+            with ThreadPoolExecutor(max_workers=self.MAX_WORKERS) as own_executor:
+                return self._analyze_sitemap(base_url, own_executor, robots_future)
+        
+        # Fetch every candidate at once; the first non-empty one in list order wins
+        futures = [executor.submit(self._parse_sitemap, url) for url in sitemap_locations]
         
-        for sitemap_url in sitemap_locations:
+        # Add sitemaps from robots.txt
+        if robots_future is not None:
+            robots_sitemaps = robots_future.result().get('sitemaps', [])
+        elif 'robots_txt' in self.results:
+            robots_sitemaps = self.results['robots_txt'].get('sitemaps', [])
+        else:
+            robots_sitemaps = []
+        
+        for sitemap_url in robots_sitemaps:
+            if sitemap_url not in sitemap_locations:
+                sitemap_locations.append(sitemap_url)
+                futures.append(executor.submit(self._parse_sitemap, sitemap_url))
+        
+        for sitemap_url, future in zip(sitemap_locations, futures):
             try:
-                urls = self._parse_sitemap(sitemap_url)
+                urls = future.result()
                 if urls:
                     result['exists'] = True
                     result['urls_count'] = len(urls)
@@ -281,6 +369,9 @@ class DiscoveryScanner:
                     result['url_patterns'] = self._analyze_url_patterns(urls)
                     
                     print(f"    ✓ Found {len(urls)} URLs in sitemap")
+                    
+                    for pending in futures:
+                        pending.cancel()
                     break
                     
             except Exception as e:
@@ -291,38 +382,70 @@ class DiscoveryScanner:
         
         return result
     
-    def _parse_sitemap(self, sitemap_url: str) -> List[str]:
-        """Parse a sitemap XML and return list of URLs"""
+    def _parse_sitemap(self, sitemap_url: str, depth: int = 0,
+                       visited: Optional[Set[str]] = None) -> List[str]:
+        """
+        Parse a sitemap XML and return list of URLs
+        
+        Args:
+            sitemap_url: Sitemap or sitemap index URL
+            depth: Sitemap index levels above this one
+            visited: Sitemap URLs already claimed in this sitemap tree
+            
+        Returns:
+            Page URLs listed by the sitemap and its sub-sitemaps
+        """
         urls = []
+        if visited is None:
+            visited = {sitemap_url}
         
         try:
-            req = Request(sitemap_url, headers={
-                'User-Agent': 'Mozilla/5.0 (compatible; LinuxSpider/1.4)'
-            })
-            
-            with urlopen(req, timeout=self.REQUEST_TIMEOUT) as response:
-                content = response.read()
-            
-            # Parse XML
-            root = ET.fromstring(content)
-            
-            # Handle namespace
-            ns = {'sm': 'http://www.sitemaps.org/schemas/sitemap/0.9'}
+            # The body is streamed straight into iterparse: parsing overlaps
+            # the download, and only <loc> texts are kept, with each <url> /
+            # <sitemap> entry dropped once read, so neither the raw bytes nor
+            # a full element tree is ever held in memory
+            with self._fetch_slots:
+                response = self.http_client.get(
+                    sitemap_url, headers={'User-Agent': self.USER_AGENT}, stream=True
+                )
+                
+                if response is None:
+                    return urls
+                
+                try:
+                    if not response:
+                        return urls
+                    
+                    response.raw.decode_content = True
+                    sitemap_locs, page_locs = self._iter_sitemap_locs(response.raw)
+                finally:
+                    # Returns the connection to the pool, even if parsing stopped early
+                    response.close()
             
-            # Check if it's a sitemap index
-            sitemaps = root.findall('.//sm:sitemap/sm:loc', ns) or root.findall('.//sitemap/loc')
-            if sitemaps:
-                # It's a sitemap index, parse each sitemap
-                for sitemap in sitemaps[:5]:  # Limit to 5 sub-sitemaps
-                    sub_urls = self._parse_sitemap(sitemap.text)
-                    urls.extend(sub_urls)
-                    time.sleep(0.5)  # Be polite
+            if sitemap_locs:
+                # It's a sitemap index, parse the sub-sitemaps concurrently.
+                # A pool per index keeps nested indexes from starving a shared
+                # pool; _fetch_slots bounds the total requests in flight.
+                # Sitemaps already seen in this tree are skipped and nesting
+                # is capped, so cyclic indexes stop after bounded work.
+                if depth >= self.MAX_SITEMAP_DEPTH:
+                    return urls
+                
+                with self._sitemap_lock:
+                    sub_sitemaps = [
+                        loc for loc in dict.fromkeys(sitemap_locs) if loc not in visited
+                    ][:self.MAX_SUB_SITEMAPS]
+                    visited.update(sub_sitemaps)
+                
+                if sub_sitemaps:
+                    with ThreadPoolExecutor(max_workers=len(sub_sitemaps)) as executor:
+                        for sub_urls in executor.map(
+                            lambda loc: self._parse_sitemap(loc, depth + 1, visited), sub_sitemaps
+                        ):
+                            urls.extend(sub_urls)
             else:
                 # Regular sitemap
-                locs = root.findall('.//sm:url/sm:loc', ns) or root.findall('.//url/loc')
-                for loc in locs:
-                    if loc.text:
-                        urls.append(loc.text)
+                urls.extend(page_locs)
             
         except ET.ParseError:
             # Try parsing as plain text (some sitemaps are malformed)
@@ -332,40 +455,64 @@ class DiscoveryScanner:
         
         return urls
     
-    def _analyze_url_patterns(self, urls: List[str]) -> Dict[str, int]:
-        """Analyze URL patterns to understand site structure"""
-        patterns = {}
+    @classmethod
+    def _iter_sitemap_locs(cls, source) -> Tuple[List[str], List[str]]:
+        """
+        Collect <loc> values from a sitemap with ElementTree.iterparse
+        
+        Args:
+            source: File-like object with the sitemap XML
+            
+        Returns:
+            Tuple of (sub-sitemap locations, page locations)
+            
+        Raises:
+            ET.ParseError: If the document is not well-formed XML
+        """
+        sitemap_locs = []
+        page_locs = []
+        loc = None
         
-        for url in urls:
-            parsed = urlparse(url)
-            path = parsed.path
+        for _, elem in ET.iterparse(source):
+            kind = cls._SITEMAP_TAGS.get(elem.tag)
             
-            # Extract first path segment
-            segments = [s for s in path.split('/') if s]
-            if segments:
-                first_segment = f"/{segments[0]}"
-                patterns[first_segment] = patterns.get(first_segment, 0) + 1
-        
-        # Sort by count
-        return dict(sorted(patterns.items(), key=lambda x: x[1], reverse=True)[:20])
+            if kind == 'loc':
+                loc = elem.text
+            elif kind == 'url':
+                if loc:
+                    page_locs.append(loc)
+                loc = None
+                elem.clear()
+            elif kind == 'sitemap':
+                if loc:
+                    sitemap_locs.append(loc)
+                loc = None
+                elem.clear()
+        
+        return sitemap_locs, page_locs
+    
+    def _analyze_url_patterns(self, urls: List[str]) -> Dict[str, int]:
+        """Analyze URL patterns to understand site structure"""
+        # Count the first path segment of each URL
+        patterns = Counter(
+            f"/{segment}"
+            for segment in (_cached_urlparse(url).path.lstrip('/').split('/', 1)[0] for url in urls)
+            if segment
+        )
+        
+        # Most frequent first
+        return dict(patterns.most_common(20))
     
     def _collect_discovered_urls(self, results: Dict) -> None:
         """Collect URLs from various sources"""
         base_url = results['base_url']
         
-        # Add homepage
-        self.discovered_urls.add(base_url)
-        self.discovered_urls.add(f"{base_url}/")
-        
-        # Common important pages
-        common_pages = [
-            '/about', '/contact', '/services', '/products',
-            '/blog', '/news', '/faq', '/privacy', '/terms',
-            '/sitemap', '/search'
-        ]
-        
-        for page in common_pages:
-            self.discovered_urls.add(urljoin(base_url, page))
+        # Homepage and common important pages, added in one set update
+        self.discovered_urls.update((
+            base_url,
+            f"{base_url}/",
+            *(urljoin(base_url, page) for page in self.COMMON_PAGES)
+        ))
     
     def _categorize_urls(self, urls: List[str], base_url: str) -> Dict[str, List[str]]:
         """Categorize discovered URLs by type"""
@@ -377,40 +524,85 @@ class DiscoveryScanner:
             'other_pages': []
         }
         
-        for url in urls:
-            path = urlparse(url).path.lower()
+        # Shortest (most general) URLs first, so the capped buckets keep the
+        # same, most representative pages on every run
+        full_buckets = 0
+        
+        for url in sorted(urls, key=lambda url: (len(url), url)):
+            path = _cached_urlparse(url).path.lower()
             
             # Check category
-            if any(re.search(p, path) for p in self.ADMIN_PATTERNS):
-                categorized['admin_pages'].append(url)
-            elif any(re.search(p, path) for p in self.MONEY_PAGE_PATTERNS):
-                categorized['money_pages'].append(url)
-            elif any(re.search(p, path) for p in self.BLOG_PATTERNS):
-                categorized['blog_pages'].append(url)
-            elif path in ['/', '/about', '/contact', '/services', '/products', '/home']:
-                categorized['main_pages'].append(url)
+            if self._ADMIN_RE.search(path):
+                bucket = categorized['admin_pages']
+            elif self._MONEY_PAGE_RE.search(path):
+                bucket = categorized['money_pages']
+            elif self._BLOG_RE.search(path):
+                bucket = categorized['blog_pages']
+            elif path in self.MAIN_PAGE_PATHS:
+                bucket = categorized['main_pages']
             else:
-                categorized['other_pages'].append(url)
-        
-        # Limit each category
-        for key in categorized:
-            categorized[key] = categorized[key][:15]
+                bucket = categorized['other_pages']
+            
+            # Limit each category; stop once every bucket is full
+            if len(bucket) < self.MAX_URLS_PER_CATEGORY:
+                bucket.append(url)
+                if len(bucket) == self.MAX_URLS_PER_CATEGORY:
+                    full_buckets += 1
+                    if full_buckets == len(categorized):
+                        break
         
         return categorized
     
     def get_priority_urls(self, count: int = 10) -> List[str]:
         """Get priority URLs for deep scanning"""
         priority = []
+        seen = set()
         
         if hasattr(self, 'results') and 'categorized_urls' in self.results:
             cats = self.results['categorized_urls']
             
             # Priority order: main > money > blog > admin > other
-            for category in ['main_pages', 'money_pages', 'blog_pages', 'admin_pages', 'other_pages']:
-                for url in cats.get(category, []):
-                    if url not in priority:
-                        priority.append(url)
+            for url in chain.from_iterable(cats.get(category, []) for category in self.PRIORITY_ORDER):
+                if url not in seen:
+                    seen.add(url)
+                    priority.append(url)
                     if len(priority) >= count:
-                        return priority
+                        break
         
         return priority
+
+
+def scan_many(urls: List[str], concurrency: int = 16,
+              per_host: int = 2) -> Dict[str, Dict[str, Any]]:
+    """
+    Run discovery scans for many targets concurrently
+    
+    Different hosts share no I/O, so their scans run side by side; scans of
+    the same host are limited to per_host at a time to stay polite.
+    
+    Args:
+        urls: Target URLs to scan
+        concurrency: Maximum scans in flight overall
+        per_host: Maximum concurrent scans per netloc
+        
+    Returns:
+        Dictionary mapping each URL to its discovery results
+    """
+    targets = list(dict.fromkeys(urls))
+    
+    # One semaphore per host; the netloc is taken the same way scan() does
+    def host_of(url: str) -> str:
+        parsed = _cached_urlparse(url)
+        return parsed.netloc or parsed.path.split('/')[0]
+    
+    host_slots = {host_of(url): threading.Semaphore(per_host) for url in targets}
+    
+    def scan_one(url: str) -> Dict[str, Any]:
+        with host_slots[host_of(url)]:
+            try:
+                return DiscoveryScanner().scan(url)
+            except Exception as e:
+                return {'base_url': url, 'error': str(e)}
+    
+    with ThreadPoolExecutor(max_workers=max(1, min(concurrency, len(targets)))) as executor:
+        return dict(zip(targets, executor.map(scan_one, targets)))
@@ -4,16 +4,90 @@ Scans domain information including registration, expiration dates, and DNS recor
 Multi-source WHOIS with RDAP, CLI, and python-whois fallback
 """
 
-import whois
 import socket
-import dns.resolver
 import subprocess
 import json
 import re
+import os
+import copy
+import time
+import ipaddress
+import sys
+import threading
+from bisect import bisect_right
+from concurrent.futures import Future, ThreadPoolExecutor, TimeoutError as FutureTimeoutError
 from datetime import datetime
-from typing import Dict, Any, Optional, List
-from urllib.request import urlopen, Request
-from urllib.error import URLError, HTTPError
+from functools import lru_cache
+from typing import Dict, Any, Optional, List, Tuple
+
+from utils.helpers import json_loads
+from utils.http_client import HTTPClient
+
+# whois, dns.resolver and tldextract are imported where they are used: each
+# costs tens of milliseconds to load, which a run without the domain module
+# should not pay
+
+
+@lru_cache(maxsize=None)
+def _tld_extractor():
+    """Return a tldextract extractor, or None when tldextract is not installed"""
+    try:
+        import tldextract
+    except ImportError:
+        return None
+    # Bundled public suffix snapshot only - no network fetch on first use
+    return tldextract.TLDExtract(suffix_list_urls=())
+
+
+class TTLCache:
+    """Thread-safe key/value store whose entries expire individually"""
+    
+    def __init__(self, max_entries: int = 4096):
+        """
+        Initialize TTL cache
+        
+        Args:
+            max_entries: Maximum cached entries before the oldest are evicted
+        """
+        self.max_entries = max_entries
+        self._entries: Dict[Any, Tuple[float, Any]] = {}
+        self._lock = threading.Lock()
+    
+    def get(self, key: Any, default: Any = None) -> Any:
+        """Return the cached value for key, or default if missing or expired"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return default
+            if entry[0] < time.monotonic():
+                del self._entries[key]
+                return default
+            return entry[1]
+    
+    def set(self, key: Any, value: Any, ttl: float) -> None:
+        """Cache value under key for ttl seconds"""
+        with self._lock:
+            self._entries.pop(key, None)
+            while len(self._entries) >= self.max_entries:
+                del self._entries[next(iter(self._entries))]
+            self._entries[key] = (time.monotonic() + ttl, value)
+    
+    def invalidate(self, domain: str) -> None:
+        """Drop every entry cached for domain"""
+        with self._lock:
+            for key in [key for key in self._entries if key[1] == domain]:
+                del self._entries[key]
+    
+    def clear(self) -> None:
+        """Drop all entries"""
+        with self._lock:
+            self._entries.clear()
+
+
+# Shared across scanner instances; keys are (kind, name[, record_type])
+lookup_cache = TTLCache()
+
+_MISSING = object()
 
 
 class DomainScanner:
@@ -29,8 +103,163 @@ class DomainScanner:
         'default': 'https://rdap.org/domain/'
     }
     
-    def __init__(self):
-        """Initialize domain scanner"""
+    DNS_RECORD_TYPES = ['A', 'AAAA', 'MX', 'NS', 'TXT', 'CNAME', 'SOA']
+    
+    # Lookup cache lifetimes (seconds); DNS answers use their own record TTL
+    NEGATIVE_CACHE_TTL = 60  # Missing records / unresolvable hosts
+    IP_CACHE_TTL = 300  # getaddrinfo does not report TTLs
+    ASN_CACHE_TTL = 3600  # ASN mappings change rarely
+    
+    # Known hosting provider address ranges (IPv4)
+    HOSTING_RANGES = [
+        ('104.16.0.0/16', 'Cloudflare'),
+        ('104.17.0.0/16', 'Cloudflare'),
+        ('104.18.0.0/16', 'Cloudflare'),
+        ('104.19.0.0/16', 'Cloudflare'),
+        ('104.20.0.0/16', 'Cloudflare'),
+        ('172.67.0.0/16', 'Cloudflare'),
+        ('34.0.0.0/8', 'Google Cloud'),
+        ('35.0.0.0/8', 'Google Cloud'),
+        ('52.0.0.0/8', 'Amazon AWS'),
+        ('54.0.0.0/8', 'Amazon AWS'),
+        ('13.0.0.0/8', 'Amazon AWS'),
+        ('157.240.0.0/16', 'Facebook/Meta'),
+        ('20.0.0.0/8', 'Microsoft Azure'),
+        ('40.0.0.0/8', 'Microsoft Azure'),
+        ('185.199.0.0/16', 'GitHub Pages'),
+        ('151.101.0.0/16', 'Fastly'),
+        ('217.182.0.0/16', 'OVH'),
+        ('5.9.0.0/16', 'Hetzner'),
+        ('195.201.0.0/16', 'Hetzner')
+    ]
+    
+    # (first address, last address, provider) as integers, sorted for bisect
+    _HOSTING_TABLE = sorted(
+        (int(network.network_address), int(network.broadcast_address), provider)
+        for network, provider in ((ipaddress.ip_network(cidr), provider) for cidr, provider in HOSTING_RANGES)
+    )
+    _HOSTING_STARTS = [first for first, _, _ in _HOSTING_TABLE]
+    
+    # RDAP eventAction -> result field
+    RDAP_DATE_FIELDS = {
+        'registration': 'creation_date',
+        'expiration': 'expiration_date',
+        'last changed': 'updated_date',
+    }
+    # fromisoformat() accepts a trailing 'Z' from Python 3.11 on
+    _ISO_Z_SUPPORTED = sys.version_info >= (3, 11)
+    
+    # CNAME keyword -> (CDN, WAF), checked in this order
+    CDN_PROVIDERS = {
+        'cloudflare': ('Cloudflare', 'Cloudflare WAF'),
+        'akamai': ('Akamai', None),
+        'fastly': ('Fastly', None),
+        'cloudfront': ('Amazon CloudFront', None),
+        'azure': ('Azure CDN', None),
+    }
+    
+    # WHOIS answers are cached per registered domain, in memory and on disk
+    WHOIS_CACHE_FILE = os.path.join(os.path.expanduser('~'), '.cache', 'linux-spider', 'whois.json')
+    WHOIS_CACHE_TTL = 24 * 60 * 60  # Registry data changes daily at most
+    WHOIS_CACHE_SIZE = 256
+    # Seconds a WHOIS source gets before the next fallback is started too
+    WHOIS_FALLBACK_DELAY = 3
+    WHOIS_CLI_TIMEOUT = 15
+    
+    # Second-level labels under ccTLDs (example.co.uk), used without tldextract
+    SECOND_LEVEL_LABELS = {'co', 'com', 'net', 'org', 'ac', 'gov', 'edu', 'sch', 'id'}
+    
+    _whois_cache: Optional[Dict[str, Dict[str, Any]]] = None
+    _whois_cache_lock = threading.Lock()
+    
+    # WHOIS text fields, each with alternative patterns in priority order
+    WHOIS_TEXT_PATTERNS = {
+        'registrar': [
+            r'Registrar:\s*(.+)',
+            r'Sponsoring Registrar:\s*(.+)',
+            r'registrar:\s*(.+)'
+        ],
+        'creation_date': [
+            r'Creation Date:\s*(.+)',
+            r'Created Date:\s*(.+)',
+            r'created:\s*(.+)',
+            r'Registration Date:\s*(.+)'
+        ],
+        'expiration_date': [
+            r'Registry Expiry Date:\s*(.+)',
+            r'Expir(?:y|ation) Date:\s*(.+)',
+            r'expires:\s*(.+)',
+            r'Expiration Date:\s*(.+)'
+        ],
+        'updated_date': [
+            r'Updated Date:\s*(.+)',
+            r'Last Updated:\s*(.+)',
+            r'modified:\s*(.+)'
+        ],
+        'name_server': [
+            r'Name Server:\s*(.+)',
+            r'nserver:\s*(.+)',
+            r'ns\d*:\s*(.+)'
+        ],
+        'org': [
+            r'Registrant Organization:\s*(.+)',
+            r'Organisation:\s*(.+)',
+            r'org:\s*(.+)'
+        ],
+        'email': [
+            r'Registrant Email:\s*(.+)',
+            r'e-mail:\s*(.+)',
+            r'([a-zA-Z0-9_.+-]+@[a-zA-Z0-9-]+\.[a-zA-Z0-9-.]+)'
+        ],
+        'status': [
+            r'Domain Status:\s*(.+)',
+            r'status:\s*(.+)'
+        ]
+    }
+    
+    # All fields in one case-insensitive alternation, scanned over the whole
+    # text: each field is a named group around its alternatives, and each
+    # alternative keeps its own capture group for the value. The patterns
+    # were written per line, so \s* must not run on into the next line.
+    _WHOIS_TEXT_RE = re.compile(
+        '|'.join(
+            f"(?P<{field}>" + '|'.join(
+                '(?:' + pattern.replace(r'\s*', r'[ \t]*') + ')' for pattern in field_patterns
+            ) + ')'
+            for field, field_patterns in WHOIS_TEXT_PATTERNS.items()
+        ),
+        re.IGNORECASE
+    )
+    
+    # WHOIS date formats in priority order, each with a cheap prefix check
+    # that accepts every string the format could parse; strptime is only
+    # tried for formats whose check passes
+    DATE_FORMATS = [
+        ('%Y-%m-%dT%H:%M:%SZ', r'\d{4}-\d\d?-\d\d?t'),
+        ('%Y-%m-%dT%H:%M:%S%z', r'\d{4}-\d\d?-\d\d?t'),
+        ('%Y-%m-%d', r'\d{4}-\d\d?-\d\d?$'),
+        ('%d-%b-%Y', r'\d\d?-[a-z]'),
+        ('%d.%m.%Y', r'\d\d?\.'),
+        ('%Y.%m.%d', r'\d{4}\.'),
+        ('%d/%m/%Y', r'\d\d?/'),
+        ('%Y/%m/%d', r'\d{4}/'),
+        ('%b %d %Y', r'[a-z]+\s'),
+        ('%d %b %Y', r'\d\d?\s')
+    ]
+    _DATE_FORMAT_TABLE = [
+        (re.compile(prefix, re.IGNORECASE), date_format) for date_format, prefix in DATE_FORMATS
+    ]
+    
+    def __init__(self, http_client: Optional[HTTPClient] = None):
+        """
+        Initialize domain scanner
+        
+        Args:
+            http_client: Shared HTTP client (a new one is created if None)
+        """
+        # Keep-alive session: RDAP queries for most TLDs go to the same
+        # registry host, so later lookups skip the TCP/TLS handshake
+        self.http_client = http_client or HTTPClient(timeout=10)
         self.results = {}
     
     def scan(self, domain: str) -> Dict[str, Any]:
@@ -45,12 +274,23 @@ class DomainScanner:
         """
         print(f"[*] Scanning domain information for: {domain}")
         
+        # WHOIS, DNS, IP and infrastructure lookups share no data, so they run
+        # side by side and the scan takes as long as the slowest (usually WHOIS)
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            whois_future = executor.submit(self._get_whois_multi_source, domain)
+            dns_future = executor.submit(self._get_dns_info, domain)
+            ip_future = executor.submit(self._get_ip_addresses, domain)
+            # Infrastructure detection reuses the resolved addresses
+            infrastructure_future = executor.submit(
+                lambda: self._get_infrastructure_info(domain, ips=ip_future.result())
+            )
+        
         results = {
             'domain': domain,
-            'whois': self._get_whois_multi_source(domain),
-            'dns': self._get_dns_info(domain),
-            'ip_addresses': self._get_ip_addresses(domain),
-            'infrastructure': self._get_infrastructure_info(domain)
+            'whois': whois_future.result(),
+            'dns': dns_future.result(),
+            'ip_addresses': ip_future.result(),
+            'infrastructure': infrastructure_future.result()
         }
         
         self.results = results
@@ -67,12 +307,74 @@ class DomainScanner:
         """
         print("  [+] Fetching WHOIS information (multi-source)...")
         
+        # Registration data belongs to the registered domain, so every
+        # subdomain of one site shares a single lookup
+        apex = self._registered_domain(domain)
+        
+        cached = self._get_cached_whois(apex)
+        if cached is not None:
+            print(f"    ✓ WHOIS for {apex} loaded from cache")
+            return cached
+        
+        whois_data = self._lookup_whois(apex)
+        if not whois_data.get('error'):
+            self._store_cached_whois(apex, whois_data)
+        
+        return whois_data
+    
+    def _lookup_whois(self, domain: str) -> Dict[str, Any]:
+        """Query RDAP, then the whois CLI and python-whois as needed, for one domain"""
+        # A fallback is only started once the source before it has failed or
+        # has been silent for WHOIS_FALLBACK_DELAY, so a working RDAP server
+        # costs no port-43 queries; results are still taken in priority
+        # order. Sources still running once a result is chosen are abandoned:
+        # they no longer print, and the CLI process is killed. python-whois
+        # cannot be interrupted, so a stalled query keeps its worker thread
+        # (and interpreter exit) waiting until its own socket timeout fires.
+        abandoned = threading.Event()
+        executor = ThreadPoolExecutor(max_workers=3)
+        try:
+            sources = [
+                lambda: self._try_rdap(domain),
+                lambda: self._try_whois_cli(domain, abandoned),
+                lambda: self._try_python_whois(domain, abandoned)
+            ]
+            futures = []
+            
+            for source in sources:
+                futures.append(executor.submit(source))
+                try:
+                    result = futures[-1].result(timeout=self.WHOIS_FALLBACK_DELAY)
+                except FutureTimeoutError:
+                    continue
+                if result and not result.get('error'):
+                    break
+            
+            futures += [None] * (len(sources) - len(futures))
+            return self._combine_whois_sources(*futures)
+        finally:
+            abandoned.set()
+            executor.shutdown(wait=False)
+    
+    def _combine_whois_sources(self, rdap_future: Future, cli_future: Optional[Future],
+                               py_future: Optional[Future]) -> Dict[str, Any]:
+        """
+        Pick and merge WHOIS results by source priority and confidence
+        
+        Args:
+            rdap_future: Pending RDAP lookup
+            cli_future: Pending whois CLI lookup (None if never started)
+            py_future: Pending python-whois lookup (None if never started)
+            
+        Returns:
+            WHOIS data with source and confidence
+        """
         whois_data = None
         source = None
         confidence = 0
         
         # Try RDAP first (most reliable)
-        rdap_result = self._try_rdap(domain)
+        rdap_result = rdap_future.result()
         if rdap_result and not rdap_result.get('error'):
             whois_data = rdap_result
             source = 'RDAP'
@@ -81,7 +383,7 @@ class DomainScanner:
         
         # Try system whois CLI
         if not whois_data or confidence < 80:
-            cli_result = self._try_whois_cli(domain)
+            cli_result = cli_future.result() if cli_future else None
             if cli_result and not cli_result.get('error'):
                 if not whois_data:
                     whois_data = cli_result
@@ -94,7 +396,7 @@ class DomainScanner:
         
         # Try python-whois as fallback
         if not whois_data or confidence < 70:
-            py_result = self._try_python_whois(domain)
+            py_result = py_future.result() if py_future else None
             if py_result and not py_result.get('error'):
                 if not whois_data:
                     whois_data = py_result
@@ -126,6 +428,85 @@ class DomainScanner:
         
         return whois_data
     
+    def _registered_domain(self, domain: str) -> str:
+        """
+        Reduce a host name to its registered (apex) domain
+        
+        Args:
+            domain: Host name, e.g. blog.example.co.uk
+            
+        Returns:
+            Registered domain, e.g. example.co.uk (IPs are returned unchanged)
+        """
+        domain = domain.lower().rstrip('.')
+        
+        try:
+            ipaddress.ip_address(domain)
+            return domain
+        except ValueError:
+            pass
+        
+        extractor = _tld_extractor()
+        if extractor is not None:
+            registered = extractor(domain).registered_domain
+            if registered:
+                return registered
+        
+        labels = domain.split('.')
+        if len(labels) > 2 and len(labels[-1]) == 2 and labels[-2] in self.SECOND_LEVEL_LABELS:
+            return '.'.join(labels[-3:])
+        return '.'.join(labels[-2:])
+    
+    @classmethod
+    def _load_whois_cache(cls) -> Dict[str, Dict[str, Any]]:
+        """Load the on-disk WHOIS cache once per process (caller holds the lock)"""
+        if cls._whois_cache is None:
+            cls._whois_cache = {}
+            try:
+                with open(cls.WHOIS_CACHE_FILE, 'r', encoding='utf-8') as f:
+                    cls._whois_cache = json.load(f)
+            except Exception:
+                pass
+        
+        return cls._whois_cache
+    
+    @classmethod
+    def _get_cached_whois(cls, apex: str) -> Optional[Dict[str, Any]]:
+        """Return a fresh cached WHOIS result for apex, or None"""
+        with cls._whois_cache_lock:
+            entry = cls._load_whois_cache().get(apex)
+        
+        if not entry or time.time() - entry.get('cached_at', 0) > cls.WHOIS_CACHE_TTL:
+            return None
+        
+        # Callers get their own copy to modify
+        return copy.deepcopy(entry['data'])
+    
+    @classmethod
+    def _store_cached_whois(cls, apex: str, data: Dict[str, Any]) -> None:
+        """Cache a WHOIS result for apex and persist the cache to disk"""
+        now = time.time()
+        
+        with cls._whois_cache_lock:
+            cache = cls._load_whois_cache()
+            cache[apex] = {'cached_at': now, 'data': copy.deepcopy(data)}
+            
+            # Drop expired entries, then the oldest ones beyond the size cap
+            fresh = sorted(
+                (item for item in cache.items() if now - item[1].get('cached_at', 0) <= cls.WHOIS_CACHE_TTL),
+                key=lambda item: item[1]['cached_at']
+            )
+            cls._whois_cache = dict(fresh[-cls.WHOIS_CACHE_SIZE:])
+            
+            try:
+                os.makedirs(os.path.dirname(cls.WHOIS_CACHE_FILE), exist_ok=True)
+                tmp_path = f"{cls.WHOIS_CACHE_FILE}.tmp"
+                with open(tmp_path, 'w', encoding='utf-8') as f:
+                    json.dump(cls._whois_cache, f, default=str)
+                os.replace(tmp_path, cls.WHOIS_CACHE_FILE)
+            except Exception:
+                pass
+    
     def _try_rdap(self, domain: str) -> Optional[Dict[str, Any]]:
         """Try RDAP lookup for domain"""
         try:
@@ -136,14 +517,18 @@ class DomainScanner:
                 return None
             
             url = f"{rdap_url}{domain}"
-            req = Request(url, headers={'Accept': 'application/rdap+json'})
+            response = self.http_client.get(url, headers={'Accept': 'application/rdap+json'})
             
-            with urlopen(req, timeout=10) as response:
-                data = json.loads(response.read().decode('utf-8'))
+            if response is None:
+                return None
             
-            return self._parse_rdap_response(data)
+            if not response:
+                print(f"    ⚠ RDAP lookup failed: HTTP {response.status_code}")
+                return None
             
-        except (URLError, HTTPError, json.JSONDecodeError, Exception) as e:
+            return self._parse_rdap_response(json_loads(response.content))
+            
+        except Exception as e:
             print(f"    ⚠ RDAP lookup failed: {e}")
             return None
     
@@ -173,24 +558,22 @@ class DomainScanner:
                             break
         
         # Get dates
+        now = datetime.now()
         for event in data.get('events', []):
-            action = event.get('eventAction', '')
+            field = self.RDAP_DATE_FIELDS.get(event.get('eventAction', ''))
             date_str = event.get('eventDate', '')
             
-            if date_str:
+            if field and date_str:
+                if not self._ISO_Z_SUPPORTED:
+                    date_str = date_str.replace('Z', '+00:00')
                 try:
-                    parsed_date = datetime.fromisoformat(date_str.replace('Z', '+00:00'))
-                    formatted = parsed_date.strftime('%Y-%m-%d')
-                    
-                    if action == 'registration':
-                        result['creation_date'] = formatted
-                    elif action == 'expiration':
-                        result['expiration_date'] = formatted
-                        result['days_until_expiration'] = (parsed_date.replace(tzinfo=None) - datetime.now()).days
-                    elif action == 'last changed':
-                        result['updated_date'] = formatted
-                except Exception:
-                    pass
+                    parsed_date = datetime.fromisoformat(date_str)
+                except ValueError:
+                    continue
+                
+                result[field] = self._format_date(parsed_date)
+                if field == 'expiration_date':
+                    result['days_until_expiration'] = (parsed_date.replace(tzinfo=None) - now).days
         
         # Get nameservers
         for ns in data.get('nameservers', []):
@@ -203,23 +586,57 @@ class DomainScanner:
         
         return result
     
-    def _try_whois_cli(self, domain: str) -> Optional[Dict[str, Any]]:
-        """Try system whois CLI command"""
+    def _try_whois_cli(self, domain: str,
+                       abandoned: Optional[threading.Event] = None) -> Optional[Dict[str, Any]]:
+        """
+        Try system whois CLI command
+        
+        Args:
+            domain: Domain name
+            abandoned: Set once the result is no longer wanted; the process
+                is then killed and nothing is reported
+            
+        Returns:
+            Parsed WHOIS data, or None on failure
+        """
         try:
-            result = subprocess.run(
+            # stderr is piped (and dropped) too: with a single pipe,
+            # communicate() ignores its timeout and blocks on read()
+            process = subprocess.Popen(
                 ['whois', domain],
-                capture_output=True,
-                text=True,
-                timeout=15
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE
             )
+            deadline = time.monotonic() + self.WHOIS_CLI_TIMEOUT
             
-            if result.returncode != 0:
+            # Wait in short slices so an abandoned lookup can be stopped
+            while True:
+                try:
+                    stdout, _ = process.communicate(timeout=0.5)
+                    break
+                except subprocess.TimeoutExpired:
+                    stop = abandoned is not None and abandoned.is_set()
+                    if stop or time.monotonic() >= deadline:
+                        # Reap without draining the pipes, which a leftover
+                        # child of the killed process could hold open
+                        process.kill()
+                        process.wait()
+                        process.stdout.close()
+                        process.stderr.close()
+                        if stop:
+                            return None
+                        raise subprocess.TimeoutExpired(['whois', domain], self.WHOIS_CLI_TIMEOUT)
+            
+            if process.returncode != 0:
                 return None
             
-            return self._parse_whois_text(result.stdout)
+            # Raw bytes are decoded leniently: some registries answer in
+            # Latin-1, which would make a strict text-mode decode raise
+            return self._parse_whois_text(stdout.decode('utf-8', errors='replace'))
             
         except (subprocess.TimeoutExpired, FileNotFoundError, Exception) as e:
-            print(f"    ⚠ CLI whois failed: {e}")
+            if abandoned is None or not abandoned.is_set():
+                print(f"    ⚠ CLI whois failed: {e}")
             return None
     
     def _parse_whois_text(self, text: str) -> Dict[str, Any]:
@@ -236,113 +653,64 @@ class DomainScanner:
             'org': 'Unknown',
             'raw_text': text[:2000]
         }
-        
-        lines = text.split('\n')
-        
-        patterns = {
-            'registrar': [
-                r'Registrar:\s*(.+)',
-                r'Sponsoring Registrar:\s*(.+)',
-                r'registrar:\s*(.+)'
-            ],
-            'creation_date': [
-                r'Creation Date:\s*(.+)',
-                r'Created Date:\s*(.+)',
-                r'created:\s*(.+)',
-                r'Registration Date:\s*(.+)'
-            ],
-            'expiration_date': [
-                r'Registry Expiry Date:\s*(.+)',
-                r'Expir(?:y|ation) Date:\s*(.+)',
-                r'expires:\s*(.+)',
-                r'Expiration Date:\s*(.+)'
-            ],
-            'updated_date': [
-                r'Updated Date:\s*(.+)',
-                r'Last Updated:\s*(.+)',
-                r'modified:\s*(.+)'
-            ],
-            'name_server': [
-                r'Name Server:\s*(.+)',
-                r'nserver:\s*(.+)',
-                r'ns\d*:\s*(.+)'
-            ],
-            'org': [
-                r'Registrant Organization:\s*(.+)',
-                r'Organisation:\s*(.+)',
-                r'org:\s*(.+)'
-            ],
-            'email': [
-                r'Registrant Email:\s*(.+)',
-                r'e-mail:\s*(.+)',
-                r'([a-zA-Z0-9_.+-]+@[a-zA-Z0-9-]+\.[a-zA-Z0-9-.]+)'
-            ],
-            'status': [
-                r'Domain Status:\s*(.+)',
-                r'status:\s*(.+)'
-            ]
-        }
-        
-        for line in lines:
-            line = line.strip()
-            
-            for field, field_patterns in patterns.items():
-                for pattern in field_patterns:
-                    match = re.search(pattern, line, re.IGNORECASE)
-                    if match:
-                        value = match.group(1).strip()
-                        
-                        if field == 'name_server':
-                            ns = value.lower().split()[0]
-                            if ns not in result['name_servers']:
-                                result['name_servers'].append(ns)
-                        elif field == 'email':
-                            if value not in result['emails'] and '@' in value:
-                                result['emails'].append(value)
-                        elif field == 'status':
-                            status = value.split()[0]
-                            if status not in result['status']:
-                                result['status'].append(status)
-                        elif field in ['creation_date', 'expiration_date', 'updated_date']:
-                            if result[field] == 'Unknown':
-                                parsed = self._parse_date_string(value)
-                                if parsed:
-                                    result[field] = parsed.strftime('%Y-%m-%d')
-                                    if field == 'expiration_date':
-                                        result['days_until_expiration'] = (parsed - datetime.now()).days
-                        else:
-                            if result.get(field) == 'Unknown':
-                                result[field] = value
-                        break
+        # Insertion-ordered dicts dedupe repeated lines without list scans
+        name_servers, statuses, emails = {}, {}, {}
+        
+        for match in self._WHOIS_TEXT_RE.finditer(text):
+            # lastindex is the field's group; its matched alternative's
+            # value is the first group after it that took part in the match
+            field = match.lastgroup
+            value = next(
+                group for group in match.groups()[match.lastindex:] if group is not None
+            ).strip()
+            
+            # A label with nothing but whitespace (or a CR) after it
+            if not value:
+                continue
+            
+            if field == 'name_server':
+                name_servers[value.lower().split()[0]] = None
+            elif field == 'email':
+                if '@' in value:
+                    emails[value] = None
+            elif field == 'status':
+                statuses[value.split()[0]] = None
+            elif field in ['creation_date', 'expiration_date', 'updated_date']:
+                if result[field] == 'Unknown':
+                    parsed = self._parse_date_string(value)
+                    if parsed:
+                        result[field] = self._format_date(parsed)
+                        if field == 'expiration_date':
+                            result['days_until_expiration'] = (parsed - datetime.now()).days
+            else:
+                if result.get(field) == 'Unknown':
+                    result[field] = value
+        
+        result['name_servers'] = list(name_servers)
+        result['status'] = list(statuses)
+        result['emails'] = list(emails)
         
         return result
     
     def _parse_date_string(self, date_str: str) -> Optional[datetime]:
         """Parse various date string formats"""
-        date_formats = [
-            '%Y-%m-%dT%H:%M:%SZ',
-            '%Y-%m-%dT%H:%M:%S%z',
-            '%Y-%m-%d',
-            '%d-%b-%Y',
-            '%d.%m.%Y',
-            '%Y.%m.%d',
-            '%d/%m/%Y',
-            '%Y/%m/%d',
-            '%b %d %Y',
-            '%d %b %Y'
-        ]
+        token = date_str.split()[0]
         
-        for fmt in date_formats:
+        for prefix, fmt in self._DATE_FORMAT_TABLE:
+            if not prefix.match(token):
+                continue
             try:
-                return datetime.strptime(date_str.split()[0], fmt)
+                return datetime.strptime(token, fmt)
             except ValueError:
                 continue
         
         return None
     
-    def _try_python_whois(self, domain: str) -> Optional[Dict[str, Any]]:
-        """Try python-whois library"""
+    def _try_python_whois(self, domain: str,
+                          abandoned: Optional[threading.Event] = None) -> Optional[Dict[str, Any]]:
+        """Try python-whois library (silent on failure once abandoned)"""
         try:
+            import whois
             w = whois.whois(domain)
             
             creation_date = self._parse_date(w.creation_date)
@@ -355,9 +723,9 @@ class DomainScanner:
             
             return {
                 'registrar': w.registrar if hasattr(w, 'registrar') and w.registrar else 'Unknown',
-                'creation_date': creation_date.strftime('%Y-%m-%d') if creation_date else 'Unknown',
-                'expiration_date': expiration_date.strftime('%Y-%m-%d') if expiration_date else 'Unknown',
-                'updated_date': updated_date.strftime('%Y-%m-%d') if updated_date else 'Unknown',
+                'creation_date': self._format_date(creation_date) if creation_date else 'Unknown',
+                'expiration_date': self._format_date(expiration_date) if expiration_date else 'Unknown',
+                'updated_date': self._format_date(updated_date) if updated_date else 'Unknown',
                 'days_until_expiration': days_until_expiration,
                 'name_servers': list(w.name_servers) if hasattr(w, 'name_servers') and w.name_servers else [],
                 'status': list(w.status) if hasattr(w, 'status') and w.status else [],
@@ -365,7 +733,8 @@ class DomainScanner:
                 'org': w.org if hasattr(w, 'org') and w.org else 'Unknown'
             }
         except Exception as e:
-            print(f"    ⚠ python-whois failed: {e}")
+            if abandoned is None or not abandoned.is_set():
+                print(f"    ⚠ python-whois failed: {e}")
             return None
     
     def _merge_whois_data(self, primary: Dict, secondary: Dict) -> Dict:
@@ -379,14 +748,22 @@ class DomainScanner:
             if result.get(key) in [None, 'Unknown', [], '']:
                 result[key] = value
             elif isinstance(value, list) and isinstance(result.get(key), list):
-                for item in value:
-                    if item not in result[key]:
-                        result[key].append(item)
+                # A new list, so the primary result's list is left untouched
+                result[key] = list(dict.fromkeys(result[key] + value))
         
         return result
     
-    def _get_infrastructure_info(self, domain: str) -> Dict[str, Any]:
-        """Get infrastructure information (CDN, WAF, hosting provider)"""
+    def _get_infrastructure_info(self, domain: str, ips: Optional[List[str]] = None) -> Dict[str, Any]:
+        """
+        Get infrastructure information (CDN, WAF, hosting provider)
+        
+        Args:
+            domain: Domain name
+            ips: Already resolved IP addresses (resolved here if None)
+            
+        Returns:
+            Dictionary with CDN, WAF, hosting and ASN details
+        """
         print("  [+] Detecting infrastructure...")
         
         info = {
@@ -397,7 +774,8 @@ class DomainScanner:
         }
         
         try:
-            ips = self._get_ip_addresses(domain)
+            if ips is None:
+                ips = self._get_ip_addresses(domain)
             if ips:
                 ip = ips[0]
                 info['hosting'] = self._detect_hosting_provider(ip)
@@ -405,20 +783,13 @@ class DomainScanner:
             
             # CDN detection via DNS CNAME
             try:
-                cname_records = dns.resolver.resolve(domain, 'CNAME')
-                for cname in cname_records:
-                    cname_str = str(cname).lower()
-                    if 'cloudflare' in cname_str:
-                        info['cdn'] = 'Cloudflare'
-                        info['waf'] = 'Cloudflare WAF'
-                    elif 'akamai' in cname_str:
-                        info['cdn'] = 'Akamai'
-                    elif 'fastly' in cname_str:
-                        info['cdn'] = 'Fastly'
-                    elif 'cloudfront' in cname_str:
-                        info['cdn'] = 'Amazon CloudFront'
-                    elif 'azure' in cname_str:
-                        info['cdn'] = 'Azure CDN'
+                for cname in self._resolve_records(domain, 'CNAME') or []:
+                    cname_str = cname.lower()
+                    vendor = next((names for keyword, names in self.CDN_PROVIDERS.items()
+                                   if keyword in cname_str), None)
+                    if vendor:
+                        info['cdn'], info['waf'] = vendor
+                        break
             except:
                 pass
             
@@ -429,43 +800,37 @@ class DomainScanner:
     
     def _detect_hosting_provider(self, ip: str) -> str:
         """Detect hosting provider from IP"""
-        known_ranges = {
-            '104.16.': 'Cloudflare',
-            '104.17.': 'Cloudflare',
-            '104.18.': 'Cloudflare',
-            '104.19.': 'Cloudflare',
-            '104.20.': 'Cloudflare',
-            '172.67.': 'Cloudflare',
-            '34.': 'Google Cloud',
-            '35.': 'Google Cloud',
-            '52.': 'Amazon AWS',
-            '54.': 'Amazon AWS',
-            '13.': 'Amazon AWS',
-            '157.240.': 'Facebook/Meta',
-            '20.': 'Microsoft Azure',
-            '40.': 'Microsoft Azure',
-            '185.199.': 'GitHub Pages',
-            '151.101.': 'Fastly',
-            '217.182.': 'OVH',
-            '5.9.': 'Hetzner',
-            '195.201.': 'Hetzner'
-        }
+        try:
+            ip_int = int.from_bytes(socket.inet_pton(socket.AF_INET, ip), 'big')
+        except OSError:
+            return 'Unknown'
         
-        for prefix, provider in known_ranges.items():
-            if ip.startswith(prefix):
-                return provider
+        # Ranges don't overlap: the only candidate is the last range
+        # starting at or below the address
+        index = bisect_right(self._HOSTING_STARTS, ip_int) - 1
+        if index >= 0 and ip_int <= self._HOSTING_TABLE[index][1]:
+            return self._HOSTING_TABLE[index][2]
         
         return 'Unknown'
     
     def _get_asn_info(self, ip: str) -> Optional[str]:
         """Get ASN info for IP"""
+        cached = lookup_cache.get(('asn', ip), _MISSING)
+        if cached is not _MISSING:
+            return cached
+        
         try:
+            import dns.resolver
             reversed_ip = '.'.join(reversed(ip.split('.')))
             query = f"{reversed_ip}.origin.asn.cymru.com"
             
             answers = dns.resolver.resolve(query, 'TXT')
+            asn = None
             for answer in answers:
-                return str(answer).strip('"')
+                asn = str(answer).strip('"')
+                break
+            lookup_cache.set(('asn', ip), asn, self.ASN_CACHE_TTL)
+            return asn
         except:
             pass
         
@@ -474,66 +839,101 @@ class DomainScanner:
     def _get_dns_info(self, domain: str) -> Dict[str, List[str]]:
         """Get DNS records for domain"""
         print("  [+] Fetching DNS records...")
-        dns_info = {
-            'A': [],
-            'AAAA': [],
-            'MX': [],
-            'NS': [],
-            'TXT': [],
-            'CNAME': [],
-            'SOA': []
-        }
         
-        record_types = ['A', 'AAAA', 'MX', 'NS', 'TXT', 'CNAME', 'SOA']
+        # Each record type is an independent round-trip, so all of them are
+        # queried at once instead of one after another
+        with ThreadPoolExecutor(max_workers=len(self.DNS_RECORD_TYPES)) as executor:
+            futures = {
+                record_type: executor.submit(self._resolve_records, domain, record_type)
+                for record_type in self.DNS_RECORD_TYPES
+            }
         
-        for record_type in record_types:
-            try:
-                answers = dns.resolver.resolve(domain, record_type)
-                for rdata in answers:
-                    if record_type == 'MX':
-                        dns_info[record_type].append(f"{rdata.preference} {rdata.exchange}")
-                    elif record_type == 'SOA':
-                        dns_info[record_type].append(f"{rdata.mname} {rdata.rname}")
-                    else:
-                        dns_info[record_type].append(str(rdata))
-            except dns.resolver.NoAnswer:
-                pass
-            except dns.resolver.NXDOMAIN:
-                print(f"  [-] Domain {domain} does not exist")
-                break
-            except Exception:
-                pass
+        dns_info = {}
+        domain_missing = False
+        
+        for record_type, future in futures.items():
+            records = future.result()
+            if records is None:
+                domain_missing = True
+                records = []
+            dns_info[record_type] = records
+        
+        if domain_missing:
+            print(f"  [-] Domain {domain} does not exist")
         
         return dns_info
     
+    def _resolve_records(self, domain: str, record_type: str) -> Optional[List[str]]:
+        """
+        Resolve one DNS record type
+        
+        Args:
+            domain: Domain name to query
+            record_type: DNS record type (A, MX, ...)
+            
+        Returns:
+            Formatted records, or None if the domain does not exist
+        """
+        key = ('dns', domain, record_type)
+        cached = lookup_cache.get(key, _MISSING)
+        if cached is not _MISSING:
+            return None if cached is None else list(cached)
+        
+        import dns.resolver
+        records = []
+        
+        try:
+            answers = dns.resolver.resolve(domain, record_type)
+            for rdata in answers:
+                if record_type == 'MX':
+                    records.append(f"{rdata.preference} {rdata.exchange}")
+                elif record_type == 'SOA':
+                    records.append(f"{rdata.mname} {rdata.rname}")
+                else:
+                    records.append(str(rdata))
+            # Kept for as long as the answer itself may be cached
+            lookup_cache.set(key, tuple(records), answers.rrset.ttl)
+        except dns.resolver.NoAnswer:
+            lookup_cache.set(key, (), self.NEGATIVE_CACHE_TTL)
+        except dns.resolver.NXDOMAIN:
+            lookup_cache.set(key, None, self.NEGATIVE_CACHE_TTL)
+            return None
+        except Exception:
+            pass
+        
+        return records
+    
     def _get_ip_addresses(self, domain: str) -> List[str]:
         """Get IP addresses for domain"""
+        cached = lookup_cache.get(('ip', domain))
+        if cached is not None:
+            return list(cached)
+        
         try:
-            ip_addresses = []
-            
+            # One AF_UNSPEC lookup returns both families in a single resolver
+            # round-trip; IPv4 is listed first, as callers key off ips[0]
             try:
-                ipv4_info = socket.getaddrinfo(domain, None, socket.AF_INET)
-                for info in ipv4_info:
-                    ip = info[4][0]
-                    if ip not in ip_addresses:
-                        ip_addresses.append(ip)
+                addr_info = socket.getaddrinfo(domain, None, socket.AF_UNSPEC, socket.SOCK_STREAM)
             except socket.gaierror:
-                pass
+                addr_info = []
             
-            try:
-                ipv6_info = socket.getaddrinfo(domain, None, socket.AF_INET6)
-                for info in ipv6_info:
-                    ip = info[4][0]
-                    if ip not in ip_addresses:
-                        ip_addresses.append(ip)
-            except socket.gaierror:
-                pass
+            # SOCK_STREAM keeps one entry per address; dict.fromkeys drops any
+            # remaining repeats (e.g. from /etc/hosts) while keeping the order
+            addr_info.sort(key=lambda info: info[0] != socket.AF_INET)
+            ip_addresses = list(dict.fromkeys(info[4][0] for info in addr_info))
             
+            ttl = self.IP_CACHE_TTL if ip_addresses else self.NEGATIVE_CACHE_TTL
+            lookup_cache.set(('ip', domain), tuple(ip_addresses), ttl)
             return ip_addresses
         except Exception as e:
             print(f"  [-] IP resolution failed: {e}")
             return []
     
+    @staticmethod
+    def _format_date(value: datetime) -> str:
+        """Format a date as YYYY-MM-DD (date.isoformat skips strftime's locale handling)"""
+        return value.date().isoformat()
+    
     def _parse_date(self, date_value) -> Optional[datetime]:
         """Parse date value from WHOIS data"""
         if not date_value:
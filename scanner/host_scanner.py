@@ -4,17 +4,28 @@ Scans hosting information including server details, headers, and infrastructure
 """
 
 import socket
-from typing import Dict, Any, List, Optional
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from typing import Dict, Any, Iterable, List, Mapping, Optional
+from utils.helpers import default_ssl_context
 from utils.http_client import HTTPClient
 
 
 class HostScanner:
     """Scanner for hosting and infrastructure information"""
     
+    # Certificate validity dates keep the ASN.1 GeneralizedTime layout
+    ASN1_TIME_FORMAT = '%Y%m%d%H%M%SZ'
+    
+    # HEAD answers that mean "method not supported" rather than a real error
+    HEAD_UNSUPPORTED_STATUSES = (405, 501)
+    
     def __init__(self):
         """Initialize host scanner"""
         self.http_client = HTTPClient()
         self.results = {}
+        # Response shared by the header, server and response checks of one scan
+        self._cached_response = None
     
     def scan(self, url: str, domain: str) -> Dict[str, Any]:
         """
@@ -29,19 +40,31 @@ class HostScanner:
         """
         print(f"[*] Scanning hosting information for: {url}")
         
-        results = {
-            'url': url,
-            'domain': domain,
-            'http_headers': self._get_http_headers(url),
-            'server_info': self._get_server_info(url),
-            'ssl_info': self._get_ssl_info(url),
-            'response_info': self._get_response_info(url)
-        }
+        # The SSL probe opens its own connection, so it runs alongside the
+        # page fetch; one GET then serves the header, server and response
+        # checks instead of a separate request each
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            ssl_future = executor.submit(self._get_ssl_info, url)
+            self._cached_response = self.http_client.get(url)
+            
+            try:
+                headers = self._get_http_headers(url)
+                
+                results = {
+                    'url': url,
+                    'domain': domain,
+                    'http_headers': dict(headers),
+                    'server_info': self._get_server_info(url, headers),
+                    'ssl_info': ssl_future.result(),
+                    'response_info': self._get_response_info(url)
+                }
+            finally:
+                self._cached_response = None
         
         self.results = results
         return results
     
-    def _get_http_headers(self, url: str) -> Dict[str, str]:
+    def _get_http_headers(self, url: str) -> Mapping[str, str]:
         """
         Get HTTP headers from server
         
@@ -49,38 +72,40 @@ class HostScanner:
             url: Target URL
             
         Returns:
-            Dictionary of HTTP headers
+            Case-insensitive mapping of HTTP headers (empty dict on failure)
         """
         try:
             print("  [+] Fetching HTTP headers...")
+            if self._cached_response is not None:
+                return self._cached_response.headers if self._cached_response else {}
+            
             response = self.http_client.head(url)
             
-            if response:
-                return dict(response.headers)
-            else:
-                # Try GET if HEAD fails
+            # Only retry with GET when the server refuses the HEAD method;
+            # any other error status would come back the same for GET
+            if response is not None and response.status_code in self.HEAD_UNSUPPORTED_STATUSES:
                 response = self.http_client.get(url)
-                if response:
-                    return dict(response.headers)
             
-            return {}
+            return response.headers if response else {}
         except Exception as e:
             print(f"  [-] Failed to get headers: {e}")
             return {}
     
-    def _get_server_info(self, url: str) -> Dict[str, Any]:
+    def _get_server_info(self, url: str, headers: Optional[Mapping[str, str]] = None) -> Dict[str, Any]:
         """
         Extract server information from headers
         
         Args:
             url: Target URL
+            headers: Already fetched HTTP headers (fetched from url if None)
             
         Returns:
             Dictionary with server details
         """
         try:
             print("  [+] Analyzing server information...")
-            headers = self._get_http_headers(url)
+            if headers is None:
+                headers = self._get_http_headers(url)
             
             return {
                 'server': headers.get('Server', 'Unknown'),
@@ -125,27 +150,25 @@ class HostScanner:
             parsed = urlparse(url)
             hostname = parsed.netloc
             
-            import ssl
-            import OpenSSL
-            
             # Get certificate
-            context = ssl.create_default_context()
+            context = default_ssl_context()
             with socket.create_connection((hostname, 443), timeout=10) as sock:
                 with context.wrap_socket(sock, server_hostname=hostname) as ssock:
                     cert_der = ssock.getpeercert(binary_form=True)
-                    cert = OpenSSL.crypto.load_certificate(
-                        OpenSSL.crypto.FILETYPE_ASN1, cert_der
-                    )
+                    # Loaded on first use; most runs never reach an HTTPS probe
+                    from cryptography import x509
+                    cert = x509.load_der_x509_certificate(cert_der)
+                    not_after = cert.not_valid_after_utc
                     
                     return {
                         'enabled': True,
                         'version': ssock.version(),
                         'cipher': ssock.cipher(),
-                        'issuer': dict(cert.get_issuer().get_components()),
-                        'subject': dict(cert.get_subject().get_components()),
-                        'not_before': cert.get_notBefore().decode('utf-8'),
-                        'not_after': cert.get_notAfter().decode('utf-8'),
-                        'has_expired': cert.has_expired()
+                        'issuer': self._name_components(cert.issuer),
+                        'subject': self._name_components(cert.subject),
+                        'not_before': cert.not_valid_before_utc.strftime(self.ASN1_TIME_FORMAT),
+                        'not_after': not_after.strftime(self.ASN1_TIME_FORMAT),
+                        'has_expired': not_after < datetime.now(timezone.utc)
                     }
         except Exception as e:
             print(f"  [-] SSL check failed: {e}")
@@ -154,6 +177,19 @@ class HostScanner:
                 'error': str(e)
             }
     
+    @staticmethod
+    def _name_components(name: Iterable) -> Dict[str, str]:
+        """
+        Flatten an X.509 name into short attribute names and values
+        
+        Args:
+            name: Certificate issuer or subject (cryptography x509.Name)
+            
+        Returns:
+            Dictionary such as {'CN': ..., 'O': ...}
+        """
+        return {attr.rfc4514_attribute_name: attr.value for attr in name}
+    
     def _get_response_info(self, url: str) -> Dict[str, Any]:
         """
         Get response information
@@ -166,7 +202,9 @@ class HostScanner:
         """
         try:
             print("  [+] Analyzing response characteristics...")
-            response = self.http_client.get(url)
+            response = self._cached_response
+            if response is None:
+                response = self.http_client.get(url)
             
             if not response:
                 return {'error': 'Failed to get response'}
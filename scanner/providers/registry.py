@@ -4,12 +4,39 @@ Manages registration and discovery of providers
 """
 
 import os
+import copy
 import json
 import yaml
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, Any, List, Optional, Type
+from utils.helpers import json_loads
 from .base import Provider, ProviderResult, ProviderStatus
 
+# libyaml's C loader when PyYAML was built with it
+YAML_LOADER = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+
+
+@lru_cache(maxsize=8)
+def _parse_config_file(path: str, mtime_ns: int) -> Any:
+    """
+    Parse a YAML or JSON config file
+    
+    Cached per modification time, so a file is only parsed again after it
+    changes. Callers must copy the result before modifying it.
+    
+    Args:
+        path: Config file path
+        mtime_ns: File modification time (cache key only)
+        
+    Returns:
+        Parsed configuration
+    """
+    with open(path, 'rb') as f:
+        if path.endswith('.yaml') or path.endswith('.yml'):
+            return yaml.load(f, Loader=YAML_LOADER)
+        return json_loads(f.read())
+
 
 class ProviderRegistry:
     """
@@ -47,17 +74,16 @@ class ProviderRegistry:
         """Find providers config file"""
         base_path = Path(__file__).parent.parent.parent / 'config'
         
-        # Try YAML first, then JSON
+        # Try YAML first (hand-edited), then JSON
         yaml_path = base_path / 'providers.yaml'
         json_path = base_path / 'providers.json'
         
         if yaml_path.exists():
             return str(yaml_path)
-        elif json_path.exists():
-            return str(json_path)
         else:
-            # Return YAML path as default (will be created)
-            return str(yaml_path)
+            # Return JSON path as default (will be created); it loads and
+            # saves far faster than YAML when nobody edits it by hand
+            return str(json_path)
     
     def _load_config(self):
         """Load configuration from file"""
@@ -67,11 +93,8 @@ class ProviderRegistry:
             return
         
         try:
-            with open(self._config_path, 'r', encoding='utf-8') as f:
-                if self._config_path.endswith('.yaml') or self._config_path.endswith('.yml'):
-                    self._config = yaml.safe_load(f) or {}
-                else:
-                    self._config = json.load(f)
+            config = _parse_config_file(self._config_path, os.stat(self._config_path).st_mtime_ns)
+            self._config = copy.deepcopy(config) or {}
         except Exception as e:
             print(f"[!] Failed to load providers config: {e}")
             self._config = self._get_default_config()
@@ -126,9 +126,14 @@ class OnPageSEO:
     DESC_MAX = 160
     MIN_WORD_COUNT = 300
     
-    def __init__(self):
-        """Initialize on-page SEO analyzer"""
-        self.http_client = HTTPClient(timeout=15)
+    def __init__(self, http_client: Optional[HTTPClient] = None):
+        """
+        Initialize on-page SEO analyzer
+        
+        Args:
+            http_client: Shared HTTP client (a new one is created if None)
+        """
+        self.http_client = http_client or HTTPClient(timeout=15)
     
     def analyze(self, url: str, html_content: str = None) -> OnPageSEOResult:
         """
@@ -9,6 +9,8 @@ from dataclasses import dataclass, field
 import time
 import re
 
+import requests
+
 from bs4 import BeautifulSoup
 from utils.http_client import HTTPClient
 
@@ -89,16 +91,26 @@ class TechnicalSEO:
     - Mobile viewport
     """
     
-    def __init__(self):
-        """Initialize technical SEO analyzer"""
-        self.http_client = HTTPClient(timeout=15)
+    def __init__(self, http_client: Optional[HTTPClient] = None):
+        """
+        Initialize technical SEO analyzer
+        
+        Args:
+            http_client: Shared HTTP client (a new one is created if None)
+        """
+        self.http_client = http_client or HTTPClient(timeout=15)
     
-    def analyze(self, url: str) -> TechnicalSEOResult:
+    def analyze(self, url: str, response: Optional[requests.Response] = None,
+                robots_response: Optional[requests.Response] = None,
+                load_time_ms: Optional[float] = None) -> TechnicalSEOResult:
         """
         Perform technical SEO analysis
         
         Args:
             url: Target URL
+            response: Already fetched (redirect-following) response for url
+            robots_response: Already fetched response for /robots.txt
+            load_time_ms: Full duration of the prefetch, body included
             
         Returns:
             TechnicalSEOResult
@@ -121,10 +133,11 @@ class TechnicalSEO:
                 'fix': 'Install SSL certificate and redirect HTTP to HTTPS'
             })
         
-        # Fetch page and measure performance
-        start_time = time.time()
-        response = self.http_client.get(url, allow_redirects=False)
-        result.ttfb_ms = (time.time() - start_time) * 1000
+        # Fetch page and measure performance, unless the caller already did
+        if response is None:
+            response = self._fetch_page(url, result)
+        elif response:
+            self._record_prefetched_timing(response, result, load_time_ms)
         
         if not response:
             result.issues.append({
@@ -134,33 +147,7 @@ class TechnicalSEO:
             })
             return result
         
-        # Follow redirects manually to track chain
-        redirect_chain = []
-        current_response = response
-        current_url = url
-        
-        while current_response.is_redirect and len(redirect_chain) < 10:
-            redirect_chain.append(current_url)
-            current_url = current_response.headers.get('Location', '')
-            if current_url:
-                current_url = urljoin(current_url if current_url.startswith('http') else url, current_url)
-                current_response = self.http_client.get(current_url, allow_redirects=False)
-                if not current_response:
-                    break
-            else:
-                break
-        
-        # Get final response
-        if redirect_chain:
-            result.redirect_chain = redirect_chain
-            result.redirect_count = len(redirect_chain)
-            final_response = self.http_client.get(url)
-            if final_response:
-                response = final_response
-        
         result.status_code = response.status_code
-        end_time = time.time()
-        result.load_time_ms = (end_time - start_time) * 1000
         result.page_size_bytes = len(response.content)
         
         # Check redirect issues
@@ -235,7 +222,7 @@ class TechnicalSEO:
             })
         
         # Check robots.txt
-        self._check_robots_txt(base_url, result)
+        self._check_robots_txt(base_url, result, robots_response)
         
         # Check sitemap
         self._check_sitemap(base_url, result)
@@ -277,12 +264,88 @@ class TechnicalSEO:
         
         return result
     
-    def _check_robots_txt(self, base_url: str, result: TechnicalSEOResult):
-        """Check robots.txt"""
+    def _fetch_page(self, url: str, result: TechnicalSEOResult) -> Optional[requests.Response]:
+        """
+        Fetch url hop by hop, recording TTFB, load time and the redirect chain
+        
+        Args:
+            url: Target URL
+            result: TechnicalSEOResult to update
+            
+        Returns:
+            Final response, or the failed first response
+        """
+        start_time = time.time()
+        response = self.http_client.get(url, allow_redirects=False)
+        result.ttfb_ms = (time.time() - start_time) * 1000
+        
+        if not response:
+            return response
+        
+        # Follow redirects manually to track chain
+        redirect_chain = []
+        current_response = response
+        current_url = url
+        
+        while current_response.is_redirect and len(redirect_chain) < 10:
+            redirect_chain.append(current_url)
+            current_url = current_response.headers.get('Location', '')
+            if current_url:
+                current_url = urljoin(current_url if current_url.startswith('http') else url, current_url)
+                current_response = self.http_client.get(current_url, allow_redirects=False)
+                if not current_response:
+                    break
+            else:
+                break
+        
+        # Get final response
+        if redirect_chain:
+            result.redirect_chain = redirect_chain
+            result.redirect_count = len(redirect_chain)
+            final_response = self.http_client.get(url)
+            if final_response:
+                response = final_response
+        
+        end_time = time.time()
+        result.load_time_ms = (end_time - start_time) * 1000
+        
+        return response
+    
+    def _record_prefetched_timing(self, response: requests.Response, result: TechnicalSEOResult,
+                                  load_time_ms: Optional[float] = None):
+        """
+        Take TTFB, load time and the redirect chain from a prefetched response
+        
+        requests records every redirect hop in history and the time until
+        each hop's headers arrived in elapsed, so no extra fetch is needed.
+        elapsed stops before the body is read, so the load time comes from
+        the caller's own timing of the fetch when given.
+        
+        Args:
+            response: Redirect-following response
+            result: TechnicalSEOResult to update
+            load_time_ms: Full duration of the fetch, body included
+        """
+        hops = response.history + [response]
+        result.ttfb_ms = hops[0].elapsed.total_seconds() * 1000
+        if load_time_ms is not None:
+            result.load_time_ms = load_time_ms
+        else:
+            # Without the caller's timing only time-to-headers is known
+            result.load_time_ms = sum(hop.elapsed.total_seconds() for hop in hops) * 1000
+        
+        if response.history:
+            result.redirect_chain = [hop.url for hop in response.history]
+            result.redirect_count = len(result.redirect_chain)
+    
+    def _check_robots_txt(self, base_url: str, result: TechnicalSEOResult,
+                          response: Optional[requests.Response] = None):
+        """Check robots.txt, reusing an already fetched response if given"""
         robots_url = urljoin(base_url, '/robots.txt')
         
         try:
-            response = self.http_client.get(robots_url)
+            if response is None:
+                response = self.http_client.get(robots_url)
             if response and response.status_code == 200:
                 result.robots_txt_exists = True
                 content = response.text
@@ -2,10 +2,46 @@
 Helper functions for web scanning
 """
 
+import json
 import re
+import ssl
+import sys
 import validators
-from urllib.parse import urlparse
-from typing import Optional
+from functools import lru_cache
+from urllib.parse import urljoin, urlparse
+from typing import Any, Optional
+
+try:
+    import ada_url
+    ADA_URL_AVAILABLE = True
+except ImportError:
+    ADA_URL_AVAILABLE = False
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+# Keyword arguments for @dataclass that give instances __slots__ (no per-instance
+# __dict__) where supported; slots=True requires Python 3.10+
+DATACLASS_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+
+@lru_cache(maxsize=None)
+def default_ssl_context() -> ssl.SSLContext:
+    """
+    Get a shared verifying SSL context
+    
+    Building one loads and parses the system CA bundle (tens of
+    milliseconds), so it is done once on first use; SSLContext is safe to
+    share between threads as long as it is not modified
+    
+    Returns:
+        Default client SSL context
+    """
+    return ssl.create_default_context()
 
 
 def normalize_url(url: str) -> Optional[str]:
@@ -52,6 +88,86 @@ def extract_domain(url: str) -> Optional[str]:
         return None
 
 
+def json_dumps_bytes(data: Any) -> bytes:
+    """
+    Serialize data to UTF-8 JSON bytes
+    
+    Uses orjson when installed, the stdlib json module otherwise
+    
+    Args:
+        data: JSON-serializable data
+        
+    Returns:
+        Encoded JSON document
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(data)
+    
+    return json.dumps(data, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+
+def json_loads(data: bytes) -> Any:
+    """
+    Parse a UTF-8 JSON document without decoding it to str first
+    
+    Uses orjson when installed, the stdlib json module otherwise
+    
+    Args:
+        data: Encoded JSON document
+        
+    Returns:
+        Parsed data
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    
+    return json.loads(data)
+
+
+def join_url(base: str, url: str) -> str:
+    """
+    Resolve a possibly relative URL against a base URL
+    
+    Uses the ada-url WHATWG parser when installed, urllib otherwise
+    
+    Args:
+        base: Base URL
+        url: Absolute or relative URL
+        
+    Returns:
+        Absolute URL
+    """
+    if ADA_URL_AVAILABLE:
+        try:
+            return ada_url.join_url(base, url)
+        except ValueError:
+            pass
+    
+    return urljoin(base, url)
+
+
+def url_origin(url: str) -> str:
+    """
+    Get the scheme://host[:port] origin of a URL
+    
+    Args:
+        url: Input URL
+        
+    Returns:
+        Origin string (e.g., "https://example.com")
+    """
+    if ADA_URL_AVAILABLE:
+        try:
+            origin = ada_url.URL(url).origin
+            if origin != 'null':
+                return origin
+        except ValueError:
+            pass
+    
+    parsed = urlparse(url)
+    return f"{parsed.scheme}://{parsed.netloc}"
+
+
 def is_wordpress_site(html_content: str) -> bool:
     """
     Check if site is running WordPress based on HTML content
@@ -3,10 +3,56 @@ HTTP Client with random User-Agent support for web scanning
 """
 
 import random
+import threading
+import time
 import requests
 from typing import Optional, Dict, Any
 
 
+class NegativeCache:
+    """Thread-safe, time-limited record of URLs that recently failed a probe"""
+    
+    def __init__(self, ttl: int = 900, max_entries: int = 4096):
+        """
+        Initialize negative cache
+        
+        Args:
+            ttl: Seconds a failure is remembered
+            max_entries: Maximum remembered failures before the oldest are evicted
+        """
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._expires: Dict[str, float] = {}
+        self._lock = threading.Lock()
+    
+    def __contains__(self, key: str) -> bool:
+        with self._lock:
+            expires = self._expires.get(key)
+            if expires is None:
+                return False
+            if expires < time.monotonic():
+                del self._expires[key]
+                return False
+            return True
+    
+    def add(self, key: str) -> None:
+        """Remember a failed probe for key"""
+        with self._lock:
+            self._expires.pop(key, None)
+            while len(self._expires) >= self.max_entries:
+                del self._expires[next(iter(self._expires))]
+            self._expires[key] = time.monotonic() + self.ttl
+    
+    def clear(self) -> None:
+        """Forget all remembered failures"""
+        with self._lock:
+            self._expires.clear()
+
+
+# Shared across scanner instances so re-scans skip recently failed probes
+probe_miss_cache = NegativeCache()
+
+
 class HTTPClient:
     """HTTP client with randomized User-Agent headers"""
     
@@ -21,6 +67,10 @@ class HTTPClient:
         'Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/121.0.0.0 Safari/537.36 Edg/121.0.0.0',
     ]
     
+    # Connection pool sizing: hosts cached, and sockets kept per host
+    POOL_CONNECTIONS = 20
+    POOL_MAXSIZE = 50
+    
     def __init__(self, timeout: int = 10):
         """
         Initialize HTTP client
@@ -30,6 +80,15 @@ class HTTPClient:
         """
         self.timeout = timeout
         self.session = requests.Session()
+        
+        # One client may be shared by several scanners and their worker
+        # threads, so keep more than requests' default 10 sockets per host
+        adapter = requests.adapters.HTTPAdapter(
+            pool_connections=self.POOL_CONNECTIONS,
+            pool_maxsize=self.POOL_MAXSIZE
+        )
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
     
     def _get_random_user_agent(self) -> str:
         """Get a random User-Agent string"""
@@ -236,6 +236,22 @@ def get_logger(
     return _global_logger
 
 
+def get_module_logger(module_name: str) -> logging.Logger:
+    """
+    Get a stdlib logger for a scanner module
+    
+    Records propagate to the global WebScanner logger, so they reach its
+    console and file handlers once get_logger() has been called.
+    
+    Args:
+        module_name: Usually __name__ of the calling module
+        
+    Returns:
+        logging.Logger
+    """
+    return logging.getLogger("WebScanner").getChild(module_name)
+
+
 def set_debug_mode(enabled: bool):
     """Enable or disable debug mode for global logger"""
     global _global_logger